@@ -108,8 +108,21 @@ class Settings(BaseSettings):
             self.logs_dir
         ]
         
+        # One listing per parent directory instead of a mkdir attempt per path;
+        # only the directories that are actually missing get created
+        existing = {}
         for directory in directories:
-            os.makedirs(directory, exist_ok=True)
+            path = os.path.abspath(directory)
+            parent = os.path.dirname(path)
+            if parent not in existing:
+                try:
+                    with os.scandir(parent) as entries:
+                        existing[parent] = {e.name for e in entries if e.is_dir()}
+                except FileNotFoundError:
+                    existing[parent] = set()
+            
+            if os.path.basename(path) not in existing[parent]:
+                os.makedirs(path, exist_ok=True)
     
     class Config:
         env_file = ".env"
@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Tuple, Union
 from datetime import datetime, date
 from difflib import SequenceMatcher
 from collections import Counter
@@ -16,19 +16,19 @@ class DataProcessor:
         self.db = db
         self.crud = FormularioCRUD(db)
     
-    def clean_data(self, raw_data: List[Dict]) -> pd.DataFrame:
-        """Clean and normalize raw form data"""
-        if not raw_data:
+    def clean_data(self, raw_data: Union[List[Dict], pd.DataFrame]) -> pd.DataFrame:
+        """Clean and normalize raw form data (list of dicts or a DataFrame)"""
+        if raw_data is None or len(raw_data) == 0:
             return pd.DataFrame()
         
-        # Convert to DataFrame
-        df = pd.DataFrame(raw_data)
+        # Convert to DataFrame (copy so cached frames are never mutated)
+        df = pd.DataFrame(raw_data).copy()
         
-        # Clean text fields
+        # Clean text fields (vectorized .str ops instead of a per-row apply)
         text_columns = ['nombre_completo', 'correo_institucional']
         for col in text_columns:
             if col in df.columns:
-                df[col] = df[col].apply(self._clean_text)
+                df[col] = self._clean_text_series(df[col])
         
         # Normalize dates
         date_columns = ['fecha_envio', 'fecha_revision']
@@ -38,19 +38,28 @@ class DataProcessor:
         
         # Normalize email addresses
         if 'correo_institucional' in df.columns:
-            df['correo_institucional'] = df['correo_institucional'].apply(self._normalize_email)
+            df['correo_institucional'] = self._normalize_email_series(df['correo_institucional'])
         
         # Add derived columns
-        df['year'] = df['fecha_envio'].dt.year if 'fecha_envio' in df.columns else None
-        df['quarter'] = df['fecha_envio'].dt.quarter if 'fecha_envio' in df.columns else None
-        df['month'] = df['fecha_envio'].dt.month if 'fecha_envio' in df.columns else None
+        if 'fecha_envio' in df.columns:
+            fechas = df['fecha_envio'].dt
+            df['year'] = fechas.year
+            df['quarter'] = fechas.quarter
+            df['month'] = fechas.month
+        else:
+            df['year'] = df['quarter'] = df['month'] = None
         
         return df
     
-    def detect_duplicates(self, df: pd.DataFrame, threshold: float = 0.8) -> pd.DataFrame:
-        """Detect potential duplicate entries using fuzzy matching"""
+    def detect_duplicates(self, df: pd.DataFrame, threshold: float = 0.8,
+                          return_indices: bool = False) -> Union[pd.DataFrame, Tuple[pd.DataFrame, np.ndarray]]:
+        """Detect potential duplicate entries using fuzzy matching
+        
+        With return_indices=True also returns the sorted row positions flagged
+        as duplicates, so callers don't need to rescan the is_duplicate column.
+        """
         if df.empty or 'nombre_completo' not in df.columns:
-            return df
+            return (df, np.empty(0, dtype=np.intp)) if return_indices else df
         
         df = df.copy()
         df['is_duplicate'] = False
@@ -93,6 +102,11 @@ class DataProcessor:
             
             processed_indices.add(i)
         
+        if return_indices:
+            dup_idx = np.sort(np.fromiter(
+                (idx for group in duplicate_groups for idx in group), dtype=np.intp))
+            return df, dup_idx
+        
         return df
     
     def calculate_metrics(self, df: pd.DataFrame, period: str = 'all') -> Dict[str, Any]:
@@ -163,6 +177,28 @@ class DataProcessor:
         
         return email
     
+    def _clean_text_series(self, series: pd.Series) -> pd.Series:
+        """Vectorized equivalent of _clean_text for a whole column"""
+        text = series.where(series.map(lambda value: isinstance(value, str)), '').astype(str)
+        text = text.str.strip().str.replace(r'\s+', ' ', regex=True)
+        
+        for abbreviation in ('Dr', 'Dra', 'Mtro', 'Mtra'):
+            text = text.str.replace(rf'\b{abbreviation}\.\s*', f'{abbreviation}. ',
+                                    regex=True, case=False)
+        
+        return text
+    
+    def _normalize_email_series(self, series: pd.Series) -> pd.Series:
+        """Vectorized equivalent of _normalize_email for a whole column"""
+        email = series.where(series.map(lambda value: isinstance(value, str)), '').astype(str)
+        email = email.str.lower().str.strip()
+        
+        # Remove common typos
+        email = email.str.replace(r'\.{2,}', '.', regex=True)  # Multiple dots
+        email = email.str.replace(r'@{2,}', '@', regex=True)  # Multiple @
+        
+        return email
+    
     def _calculate_similarity(self, str1: str, str2: str) -> float:
         """Calculate similarity between two strings"""
         if not str1 or not str2:
@@ -2,7 +2,11 @@
 Simple audit logging system
 """
 
+import atexit
 import logging
+import queue
+import threading
+import time
 from datetime import datetime
 from typing import Optional, Dict, Any
 from sqlalchemy.orm import Session
@@ -13,6 +17,16 @@ from app.database.connection import SessionLocal
 class SimpleAuditLogger:
     """Simple audit logging system"""
     
+    # Deferred writes are flushed in batches of up to this many entries...
+    BATCH_SIZE = 32
+    # ...or after this many seconds, whichever comes first
+    FLUSH_INTERVAL = 0.1
+    # Max seconds to wait at interpreter exit for queued entries to be written
+    SHUTDOWN_TIMEOUT = 5.0
+    
+    # Queue sentinel: write what is pending, then stop the writer
+    _STOP = object()
+    
     def __init__(self):
         """Initialize audit logger"""
         self.logger = logging.getLogger("audit")
@@ -23,6 +37,14 @@ class SimpleAuditLogger:
             formatter = logging.Formatter('%(asctime)s - AUDIT - %(levelname)s - %(message)s')
             handler.setFormatter(formatter)
             self.logger.addHandler(handler)
+        
+        # Background writer for deferred entries (started on first use)
+        self._queue = queue.Queue()
+        self._worker = None
+        self._worker_lock = threading.Lock()
+        
+        # Flush deferred entries on exit instead of losing them with the daemon thread
+        atexit.register(self.shutdown)
     
     def log_action(self, action: AuditActionEnum, description: str, 
                    user_id: Optional[str] = None, user_name: Optional[str] = None,
@@ -58,16 +80,108 @@ class SimpleAuditLogger:
             self.logger.info(f"AUDIT FALLBACK: [{action}] {description}")
             return None
     
-    def log_form_approval(self, form_id: int, form_owner: str, approved_by: str):
+    def log_action_deferred(self, action: AuditActionEnum, description: str,
+                            user_id: Optional[str] = None, user_name: Optional[str] = None,
+                            severity: AuditSeverityEnum = AuditSeverityEnum.INFO):
+        """Queue an audit action to be written in batch by the background writer"""
+        self._ensure_worker()
+        self._queue.put((action, description, user_id, user_name, severity))
+    
+    def _ensure_worker(self):
+        """Start the background writer thread if it is not running"""
+        if self._worker is not None and self._worker.is_alive():
+            return
+        
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._drain_queue, name="audit-writer", daemon=True
+                )
+                self._worker.start()
+    
+    def shutdown(self):
+        """Write every queued entry and stop the background writer"""
+        with self._worker_lock:
+            worker = self._worker
+            if worker is None or not worker.is_alive():
+                return
+            self._queue.put(self._STOP)
+        worker.join(self.SHUTDOWN_TIMEOUT)
+    
+    def _drain_queue(self):
+        """Collect queued entries into batches and write them until stopped"""
+        while True:
+            entry = self._queue.get()
+            if entry is self._STOP:
+                return
+            
+            batch = [entry]
+            stopping = False
+            deadline = time.monotonic() + self.FLUSH_INTERVAL
+            
+            while len(batch) < self.BATCH_SIZE:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    entry = self._queue.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if entry is self._STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+            
+            self._write_batch(batch)
+            if stopping:
+                return
+    
+    def _write_batch(self, batch):
+        """Write a batch of audit entries in a single transaction"""
+        db = SessionLocal()
+        try:
+            db.add_all([
+                AuditLog(
+                    action=action,
+                    severity=severity,
+                    user_id=user_id,
+                    user_name=user_name,
+                    description=description
+                )
+                for action, description, user_id, user_name, severity in batch
+            ])
+            db.commit()
+            
+            for action, description, user_id, _, _ in batch:
+                log_message = f"[{action}] {description}"
+                if user_id:
+                    log_message += f" | User: {user_id}"
+                self.logger.info(log_message)
+        
+        except Exception as e:
+            db.rollback()
+            self.logger.error(f"Failed to write audit log batch: {e}")
+            for action, description, _, _, _ in batch:
+                self.logger.info(f"AUDIT FALLBACK: [{action}] {description}")
+        finally:
+            db.close()
+    
+    def log_form_approval(self, form_id: int, form_owner: str, approved_by: str,
+                          deferred: bool = False):
         """Log form approval"""
         description = f"Form #{form_id} (owner: {form_owner}) approved by {approved_by}"
+        if deferred:
+            return self.log_action_deferred(AuditActionEnum.FORM_APPROVAL, description, approved_by, approved_by)
         return self.log_action(AuditActionEnum.FORM_APPROVAL, description, approved_by, approved_by)
     
-    def log_form_rejection(self, form_id: int, form_owner: str, rejected_by: str, reason: str = ""):
+    def log_form_rejection(self, form_id: int, form_owner: str, rejected_by: str, reason: str = "",
+                           deferred: bool = False):
         """Log form rejection"""
         description = f"Form #{form_id} (owner: {form_owner}) rejected by {rejected_by}"
         if reason:
             description += f" - Reason: {reason}"
+        if deferred:
+            return self.log_action_deferred(AuditActionEnum.FORM_REJECTION, description, rejected_by, rejected_by)
         return self.log_action(AuditActionEnum.FORM_REJECTION, description, rejected_by, rejected_by)
     
     def log_login(self, user_id: str, user_name: str, success: bool = True):
@@ -1,9 +1,9 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from app.config import settings
 from app.models.database import Base
-import os
 import logging
 
 # Silenciar logs de SQLAlchemy para mejor rendimiento
@@ -30,9 +30,20 @@ if settings.database_url.startswith("sqlite"):
     )
 else:
     # For other databases (PostgreSQL, MySQL, etc.)
+    batch_options = {}
+    if make_url(settings.database_url).get_driver_name() == "psycopg2":
+        # executemany en lotes: INSERT multi-VALUES y execute_batch para UPDATE/DELETE
+        batch_options["executemany_mode"] = "values_plus_batch"
+    
     engine = create_engine(
         settings.database_url,
-        echo=False  # Silenciar logs para mejor rendimiento
+        pool_size=5,
+        max_overflow=10,
+        pool_use_lifo=True,  # Reutilizar primero las conexiones más recientes (calientes)
+        pool_pre_ping=True,  # Descartar conexiones cerradas por el servidor
+        insertmanyvalues_page_size=1000,  # Filas por sentencia en inserciones masivas
+        echo=False,  # Silenciar logs para mejor rendimiento
+        **batch_options
     )
 
 # Database monitoring removed for optimization
@@ -57,9 +68,7 @@ def init_database():
     # Create tables
     create_tables()
     
-    # Create directories for file storage
-    os.makedirs(settings.upload_dir, exist_ok=True)
-    os.makedirs(settings.reports_dir, exist_ok=True)
+    # File storage directories are created when app.config is imported
     
     # print("Database initialized successfully")  # Silenciado para terminal limpia
 
@@ -1,16 +1,94 @@
-from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, func, extract
+from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import and_, or_, func, extract, select, union_all, literal, insert
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 from app.models.database import (
     FormularioEnvioDB, CursoCapacitacionDB, PublicacionDB, EventoAcademicoDB,
     DisenoCurricularDB, ExperienciaMovilidadDB, ReconocimientoDB, CertificacionDB,
-    OtraActividadAcademicaDB, AuditLogDB, EstadoFormularioEnum, MaestroAutorizadoDB
+    OtraActividadAcademicaDB, AuditLogDB, EstadoFormularioEnum, MaestroAutorizadoDB,
+    EstatusPublicacionEnum, TipoParticipacionEnum, TipoMovilidadEnum, TipoReconocimientoEnum
 )
 from app.models.schemas import (
     FormData, FormularioEnvio, EstadoFormulario, MetricasResponse
 )
 
+def _import_date(value):
+    """Date from an ISO string in an import payload"""
+    return datetime.fromisoformat(value).date() if value else None
+
+
+def _import_parent_row(form_dict: Dict[str, Any], now: datetime) -> Dict[str, Any]:
+    """Column values for the parent form of an imported form dict"""
+    return {
+        "nombre_completo": form_dict.get("nombre_completo"),
+        "correo_institucional": form_dict.get("correo_institucional"),
+        "año_academico": form_dict.get("año_academico"),
+        "trimestre": form_dict.get("trimestre"),
+        "estado": EstadoFormularioEnum(form_dict.get("estado", "PENDIENTE")),
+        "fecha_envio": form_dict.get("fecha_envio") or now,
+        "fecha_revision": form_dict.get("fecha_revision"),
+        "revisado_por": form_dict.get("revisado_por")
+    }
+
+
+# (model, key in form dict, row builder) for every child table of an imported form
+_IMPORT_CHILD_TABLES = [
+    (CursoCapacitacionDB, "cursos_capacitacion", lambda d: {
+        "nombre_curso": d.get("nombre_curso"),
+        "fecha": _import_date(d.get("fecha")),
+        "horas": d.get("horas", 0)
+    }),
+    (PublicacionDB, "publicaciones", lambda d: {
+        "autores": d.get("autores"),
+        "titulo": d.get("titulo"),
+        "evento_revista": d.get("evento_revista"),
+        "estatus": EstatusPublicacionEnum(d.get("estatus", "EN_REVISION"))
+    }),
+    (EventoAcademicoDB, "eventos_academicos", lambda d: {
+        "nombre_evento": d.get("nombre_evento"),
+        "fecha": _import_date(d.get("fecha")),
+        "tipo_participacion": TipoParticipacionEnum(d.get("tipo_participacion", "PARTICIPANTE"))
+    }),
+    (DisenoCurricularDB, "diseno_curricular", lambda d: {
+        "nombre_curso": d.get("nombre_curso"),
+        "descripcion": d.get("descripcion")
+    }),
+    (ExperienciaMovilidadDB, "movilidad", lambda d: {
+        "descripcion": d.get("descripcion"),
+        "tipo": TipoMovilidadEnum(d.get("tipo", "NACIONAL")),
+        "fecha": _import_date(d.get("fecha"))
+    }),
+    (ReconocimientoDB, "reconocimientos", lambda d: {
+        "nombre": d.get("nombre"),
+        "tipo": TipoReconocimientoEnum(d.get("tipo", "DISTINCION")),
+        "fecha": _import_date(d.get("fecha"))
+    }),
+    (CertificacionDB, "certificaciones", lambda d: {
+        "nombre": d.get("nombre"),
+        "fecha_obtencion": _import_date(d.get("fecha_obtencion"))
+    }),
+    (OtraActividadAcademicaDB, "otras_actividades", lambda d: {
+        "categoria": d.get("categoria"),
+        "titulo": d.get("titulo"),
+        "descripcion": d.get("descripcion"),
+        "fecha": _import_date(d.get("fecha")),
+        "cantidad": d.get("cantidad"),
+        "observaciones": d.get("observaciones")
+    }),
+]
+
+
+def _import_child_rows(formulario_id: int, form_dict: Dict[str, Any], key: str, build_row):
+    """Rows of one child table for an imported form, linked to its parent id"""
+    return [
+        {"formulario_id": formulario_id, **build_row(item)}
+        for item in form_dict.get(key) or []
+    ]
+
+
+_IMPORT_AUDIT_COMMENT = "Formulario importado desde backup"
+
+
 class FormularioCRUD:
     def __init__(self, db: Session):
         self.db = db
@@ -53,96 +131,18 @@ class FormularioCRUD:
         """Create a complete form from dictionary data (for imports)"""
         try:
             # Create main form record
-            db_formulario = FormularioEnvioDB(
-                nombre_completo=form_dict.get("nombre_completo"),
-                correo_institucional=form_dict.get("correo_institucional"),
-                año_academico=form_dict.get("año_academico"),
-                trimestre=form_dict.get("trimestre"),
-                estado=EstadoFormularioEnum(form_dict.get("estado", "PENDIENTE")),
-                fecha_envio=form_dict.get("fecha_envio", datetime.utcnow()),
-                fecha_revision=form_dict.get("fecha_revision"),
-                revisado_por=form_dict.get("revisado_por")
-            )
+            db_formulario = FormularioEnvioDB(**_import_parent_row(form_dict, datetime.utcnow()))
             
             self.db.add(db_formulario)
             self.db.flush()  # Get the ID without committing
             
-            # Add related records from dictionary data
-            if form_dict.get("cursos_capacitacion"):
-                for curso_data in form_dict["cursos_capacitacion"]:
-                    curso = CursoCapacitacionDB(
-                        formulario_id=db_formulario.id,
-                        nombre_curso=curso_data.get("nombre_curso"),
-                        fecha=datetime.fromisoformat(curso_data["fecha"]).date() if curso_data.get("fecha") else None,
-                        horas=curso_data.get("horas", 0)
-                    )
-                    self.db.add(curso)
-            
-            if form_dict.get("publicaciones"):
-                for pub_data in form_dict["publicaciones"]:
-                    from app.models.database import EstatusPublicacionEnum
-                    pub = PublicacionDB(
-                        formulario_id=db_formulario.id,
-                        autores=pub_data.get("autores"),
-                        titulo=pub_data.get("titulo"),
-                        evento_revista=pub_data.get("evento_revista"),
-                        estatus=EstatusPublicacionEnum(pub_data.get("estatus", "EN_REVISION"))
-                    )
-                    self.db.add(pub)
-            
-            if form_dict.get("eventos_academicos"):
-                for evento_data in form_dict["eventos_academicos"]:
-                    from app.models.database import TipoParticipacionEnum
-                    evento = EventoAcademicoDB(
-                        formulario_id=db_formulario.id,
-                        nombre_evento=evento_data.get("nombre_evento"),
-                        fecha=datetime.fromisoformat(evento_data["fecha"]).date() if evento_data.get("fecha") else None,
-                        tipo_participacion=TipoParticipacionEnum(evento_data.get("tipo_participacion", "PARTICIPANTE"))
-                    )
-                    self.db.add(evento)
-            
-            if form_dict.get("diseno_curricular"):
-                for diseno_data in form_dict["diseno_curricular"]:
-                    diseno = DisenoCurricularDB(
-                        formulario_id=db_formulario.id,
-                        nombre_curso=diseno_data.get("nombre_curso"),
-                        descripcion=diseno_data.get("descripcion")
-                    )
-                    self.db.add(diseno)
-            
-            if form_dict.get("movilidad"):
-                for mov_data in form_dict["movilidad"]:
-                    from app.models.database import TipoMovilidadEnum
-                    mov = ExperienciaMovilidadDB(
-                        formulario_id=db_formulario.id,
-                        descripcion=mov_data.get("descripcion"),
-                        tipo=TipoMovilidadEnum(mov_data.get("tipo", "NACIONAL")),
-                        fecha=datetime.fromisoformat(mov_data["fecha"]).date() if mov_data.get("fecha") else None
-                    )
-                    self.db.add(mov)
-            
-            if form_dict.get("reconocimientos"):
-                for rec_data in form_dict["reconocimientos"]:
-                    from app.models.database import TipoReconocimientoEnum
-                    rec = ReconocimientoDB(
-                        formulario_id=db_formulario.id,
-                        nombre=rec_data.get("nombre"),
-                        tipo=TipoReconocimientoEnum(rec_data.get("tipo", "DISTINCION")),
-                        fecha=datetime.fromisoformat(rec_data["fecha"]).date() if rec_data.get("fecha") else None
-                    )
-                    self.db.add(rec)
-            
-            if form_dict.get("certificaciones"):
-                for cert_data in form_dict["certificaciones"]:
-                    cert = CertificacionDB(
-                        formulario_id=db_formulario.id,
-                        nombre=cert_data.get("nombre"),
-                        fecha_obtencion=datetime.fromisoformat(cert_data["fecha_obtencion"]).date() if cert_data.get("fecha_obtencion") else None
-                    )
-                    self.db.add(cert)
+            # Same child rows as create_formularios_bulk
+            for model, key, build_row in _IMPORT_CHILD_TABLES:
+                for row in _import_child_rows(db_formulario.id, form_dict, key, build_row):
+                    self.db.add(model(**row))
             
             # Add audit log
-            self._add_audit_log(db_formulario.id, "IMPORTADO", None, "Formulario importado desde backup")
+            self._add_audit_log(db_formulario.id, "IMPORTADO", None, _IMPORT_AUDIT_COMMENT)
             
             self.db.commit()
             self.db.refresh(db_formulario)
@@ -153,12 +153,79 @@ class FormularioCRUD:
             print(f"Error creating complete form: {e}")
             return None
     
+    def create_formularios_bulk(self, form_dicts: List[Dict[str, Any]]) -> int:
+        """Create many complete forms at once (same dict layout as create_formulario_completo).
+
+        Parents are inserted with one executemany that returns their ids, and each
+        child table is filled with a single executemany, all in one transaction.
+        Returns the number of forms created.
+        """
+        if not form_dicts:
+            return 0
+        
+        try:
+            now = datetime.utcnow()
+            parent_rows = [_import_parent_row(form_dict, now) for form_dict in form_dicts]
+            
+            # RETURNING in parameter order maps each new id back to its dict
+            ids = self.db.scalars(
+                insert(FormularioEnvioDB).returning(
+                    FormularioEnvioDB.id, sort_by_parameter_order=True
+                ),
+                parent_rows
+            ).all()
+            
+            for model, key, build_row in _IMPORT_CHILD_TABLES:
+                rows = [
+                    row
+                    for formulario_id, form_dict in zip(ids, form_dicts)
+                    for row in _import_child_rows(formulario_id, form_dict, key, build_row)
+                ]
+                if rows:
+                    self.db.execute(insert(model), rows)
+            
+            self.db.execute(insert(AuditLogDB), [
+                {
+                    "formulario_id": formulario_id,
+                    "accion": "IMPORTADO",
+                    "usuario": None,
+                    "comentario": _IMPORT_AUDIT_COMMENT
+                }
+                for formulario_id in ids
+            ])
+            
+            self.db.commit()
+            return len(ids)
+            
+        except Exception as e:
+            self.db.rollback()
+            print(f"Error creating forms in bulk: {e}")
+            return 0
+    
     def get_formulario(self, formulario_id: int) -> Optional[FormularioEnvioDB]:
         """Get a form by ID with all related data"""
         return self.db.query(FormularioEnvioDB).filter(
             FormularioEnvioDB.id == formulario_id
         ).first()
     
+    def get_formulario_full(self, formulario_id: int) -> Optional[FormularioEnvioDB]:
+        """Get a form by ID with every activity collection eagerly loaded
+        
+        Collections are fetched with selectinload, so the instance can be
+        read after its session is closed without lazy-load queries.
+        """
+        return self.db.execute(
+            select(FormularioEnvioDB).options(
+                selectinload(FormularioEnvioDB.cursos_capacitacion),
+                selectinload(FormularioEnvioDB.publicaciones),
+                selectinload(FormularioEnvioDB.eventos_academicos),
+                selectinload(FormularioEnvioDB.diseno_curricular),
+                selectinload(FormularioEnvioDB.movilidad),
+                selectinload(FormularioEnvioDB.reconocimientos),
+                selectinload(FormularioEnvioDB.certificaciones)
+            ).where(FormularioEnvioDB.id == formulario_id)
+        ).scalar_one_or_none()
+    
     def get_formularios_pendientes(self, skip: int = 0, limit: int = 100) -> List[FormularioEnvioDB]:
         """Get pending forms"""
         return self.db.query(FormularioEnvioDB).filter(
@@ -209,6 +276,57 @@ class FormularioCRUD:
             FormularioEnvioDB.es_version_activa == True
         ).offset(skip).limit(limit).all()
     
+    def get_formularios_summary(
+        self,
+        estado: Optional[EstadoFormularioEnum] = None,
+        skip: int = 0,
+        limit: int = 100
+    ) -> List[Any]:
+        """Get scalar columns of active forms as rows, without hydrating ORM objects"""
+        query = self.db.query(
+            FormularioEnvioDB.id,
+            FormularioEnvioDB.nombre_completo,
+            FormularioEnvioDB.correo_institucional,
+            FormularioEnvioDB.año_academico,
+            FormularioEnvioDB.trimestre,
+            FormularioEnvioDB.estado,
+            FormularioEnvioDB.fecha_envio,
+            FormularioEnvioDB.fecha_revision,
+            FormularioEnvioDB.revisado_por
+        ).filter(
+            FormularioEnvioDB.es_version_activa == True
+        )
+        
+        if estado is not None:
+            query = query.filter(FormularioEnvioDB.estado == estado)
+        
+        return query.offset(skip).limit(limit).all()
+    
+    def get_monthly_counts(self) -> List[Any]:
+        """Count active forms per (year, month) of submission, aggregated in SQL"""
+        year = extract('year', FormularioEnvioDB.fecha_envio).label('year')
+        month = extract('month', FormularioEnvioDB.fecha_envio).label('month')
+        
+        return self.db.query(
+            year, month, func.count(FormularioEnvioDB.id).label('count')
+        ).filter(
+            FormularioEnvioDB.es_version_activa == True,
+            FormularioEnvioDB.fecha_envio.isnot(None)
+        ).group_by(year, month).order_by(year, month).all()
+    
+    def get_monthly_status_counts(self) -> List[Any]:
+        """Count active forms per (year, month, estado), aggregated in SQL"""
+        year = extract('year', FormularioEnvioDB.fecha_envio).label('year')
+        month = extract('month', FormularioEnvioDB.fecha_envio).label('month')
+        
+        return self.db.query(
+            year, month, FormularioEnvioDB.estado,
+            func.count(FormularioEnvioDB.id).label('count')
+        ).filter(
+            FormularioEnvioDB.es_version_activa == True,
+            FormularioEnvioDB.fecha_envio.isnot(None)
+        ).group_by(year, month, FormularioEnvioDB.estado).order_by(year, month).all()
+    
     def aprobar_formulario(self, formulario_id: int, usuario: str = "admin") -> bool:
         """Approve a form submission"""
         formulario = self.get_formulario(formulario_id)
@@ -327,6 +445,38 @@ class FormularioCRUD:
             total_otras_actividades=total_otras_actividades
         )
     
+    def get_conteos_actividades(self, formulario_ids: List[int]) -> Dict[str, Dict[int, int]]:
+        """Count related activities per form in a single UNION ALL of GROUP BY queries"""
+        modelos = {
+            'cursos_capacitacion': CursoCapacitacionDB,
+            'publicaciones': PublicacionDB,
+            'eventos_academicos': EventoAcademicoDB,
+            'diseno_curricular': DisenoCurricularDB,
+            'movilidad': ExperienciaMovilidadDB,
+            'reconocimientos': ReconocimientoDB,
+            'certificaciones': CertificacionDB
+        }
+        
+        conteos = {relacion: {} for relacion in modelos}
+        if not formulario_ids:
+            return conteos
+        
+        consulta = union_all(*[
+            select(
+                literal(relacion).label('relacion'),
+                modelo.formulario_id,
+                func.count(modelo.id).label('total')
+            ).where(
+                modelo.formulario_id.in_(formulario_ids)
+            ).group_by(modelo.formulario_id)
+            for relacion, modelo in modelos.items()
+        ])
+        
+        for relacion, formulario_id, total in self.db.execute(consulta):
+            conteos[relacion][formulario_id] = total
+        
+        return conteos
+    
     def get_datos_por_periodo(self, year: int, quarter: Optional[int] = None) -> Dict[str, Any]:
         """Get data for a specific period (year and optionally quarter)"""
         # Base query for approved forms
@@ -953,6 +1103,24 @@ class MaestroAutorizadoCRUD:
             self.db.rollback()
             return False
     
+    def delete_all_maestros(self) -> int:
+        """Desactiva todos los maestros activos en un solo UPDATE (soft delete)"""
+        try:
+            total = self.db.query(MaestroAutorizadoDB).filter(
+                MaestroAutorizadoDB.activo == True
+            ).update({
+                MaestroAutorizadoDB.activo: False,
+                MaestroAutorizadoDB.fecha_actualizacion: datetime.utcnow()
+            }, synchronize_session=False)
+            
+            self.db.commit()
+            return total
+            
+        except Exception as e:
+            print(f"Error desactivando maestros: {e}")
+            self.db.rollback()
+            return 0
+    
     def delete_maestro(self, maestro_id: int) -> bool:
         """Desactiva un maestro (soft delete)"""
         try:
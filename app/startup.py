@@ -37,16 +37,6 @@ def initialize_database():
         app_logger.log_operation("database_init_failed", {"error": str(e)}, "ERROR")
         raise
 
-def create_required_directories():
-    """Create required directories silently"""
-    directories = [settings.data_dir, settings.logs_dir, settings.reports_dir, settings.upload_dir]
-    
-    for directory in directories:
-        try:
-            os.makedirs(directory, exist_ok=True)
-        except Exception as e:
-            app_logger.log_operation("dir_creation_failed", {"dir": directory, "error": str(e)}, "ERROR")
-
 def validate_configuration():
     """Quick configuration validation"""
     issues = []
@@ -63,7 +53,7 @@ def startup_application():
     """Optimized startup sequence"""
     try:
         setup_logging()
-        create_required_directories()
+        # Data directories are created once when app.config is imported
         config_issues = validate_configuration()
         initialize_database()
         
@@ -0,0 +1,28 @@
+"""
+Server-wide data version for the dashboard caches.
+
+Loaders cached with st.cache_data take this version as an argument. Bumping it
+after an approve/reject makes every session miss those entries on its next run.
+"""
+
+import threading
+
+import streamlit as st
+
+
+@st.cache_resource
+def _data_version_counter():
+    """One counter per server process, shared by all sessions"""
+    return {'value': 0, 'lock': threading.Lock()}
+
+
+def get_data_version() -> int:
+    """Current server-wide data version"""
+    return _data_version_counter()['value']
+
+
+def bump_data_version():
+    """Invalidate the version-keyed loaders for every session, leaving other caches alone"""
+    counter = _data_version_counter()
+    with counter['lock']:
+        counter['value'] += 1
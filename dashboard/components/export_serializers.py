@@ -0,0 +1,90 @@
+"""
+DataFrame serializers shared by the export page and the interactive filters.
+
+Each serializer uses the fast optional backend when it is installed and falls
+back to plain pandas otherwise, so downloads keep working without it.
+"""
+
+import io
+
+# Rows converted to Arrow per step when writing large CSV exports
+EXPORT_CHUNK_ROWS = 10_000
+
+
+def csv_bytes(df) -> bytes:
+    """Serialize a DataFrame to CSV with Arrow's C++ writer when possible"""
+    try:
+        import pyarrow as pa
+        import pyarrow.csv as pa_csv
+    except ImportError:
+        return df.to_csv(index=False).encode('utf-8')
+
+    buffer = io.BytesIO()
+    try:
+        if len(df) <= EXPORT_CHUNK_ROWS:
+            pa_csv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buffer)
+            return buffer.getvalue()
+
+        # Convert and write chunk by chunk so no full Arrow copy is held
+        schema = pa.Schema.from_pandas(df, preserve_index=False)
+        with pa_csv.CSVWriter(buffer, schema) as writer:
+            for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+                chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS]
+                writer.write_table(pa.Table.from_pandas(
+                    chunk, schema=schema, preserve_index=False))
+    except (pa.ArrowException, TypeError):
+        # Mixed-type object columns can't be converted to Arrow
+        return df.to_csv(index=False).encode('utf-8')
+    return buffer.getvalue()
+
+
+def json_bytes(df) -> bytes:
+    """Serialize a DataFrame to indented JSON records (orjson when available)"""
+    try:
+        import orjson
+    except ImportError:
+        return df.to_json(orient='records', indent=2).encode('utf-8')
+
+    # Timestamps and other non-native values fall back to their string form
+    return orjson.dumps(
+        df.to_dict(orient='records'),
+        option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+        default=str
+    )
+
+
+def excel_bytes(df, sheet_name: str = 'Reportes') -> bytes:
+    """Serialize a DataFrame to XLSX, streaming rows when xlsxwriter is available"""
+    try:
+        import xlsxwriter
+    except ImportError:
+        import pandas as pd
+        buffer = io.BytesIO()
+        with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
+            df.to_excel(writer, index=False, sheet_name=sheet_name)
+        return buffer.getvalue()
+
+    buffer = io.BytesIO()
+    # constant_memory flushes each row once the next one starts, so cells
+    # must be written strictly in row order: header first, then row by row
+    workbook = xlsxwriter.Workbook(buffer, {
+        'constant_memory': True,
+        'strings_to_urls': False,
+        'nan_inf_to_errors': True,
+        'remove_timezone': True,
+        'default_date_format': 'yyyy-mm-dd hh:mm'
+    })
+    worksheet = workbook.add_worksheet(sheet_name)
+    worksheet.write_row(0, 0, [str(column) for column in df.columns])
+
+    row = 1
+    for start in range(0, len(df), EXPORT_CHUNK_ROWS):
+        # Object dtype turns numpy scalars into Python values; NaN/NaT become None
+        chunk = df.iloc[start:start + EXPORT_CHUNK_ROWS].astype(object)
+        chunk = chunk.where(chunk.notna(), None)
+        for values in chunk.itertuples(index=False, name=None):
+            worksheet.write_row(row, 0, values)
+            row += 1
+
+    workbook.close()
+    return buffer.getvalue()
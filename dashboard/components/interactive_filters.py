@@ -3,6 +3,8 @@ import pandas as pd
 from datetime import datetime, timedelta
 from typing import Dict, List, Any, Optional, Tuple
 
+from dashboard.components.export_serializers import csv_bytes, json_bytes
+
 class InteractiveFilters:
     """Class for creating interactive filters and controls"""
     
@@ -316,7 +318,7 @@ class InteractiveFilters:
         
         with col1:
             # CSV export
-            csv = df.to_csv(index=False)
+            csv = csv_bytes(df)
             st.download_button(
                 label="📥 Descargar CSV",
                 data=csv,
@@ -327,7 +329,7 @@ class InteractiveFilters:
         
         with col2:
             # JSON export
-            json_data = df.to_json(orient='records', indent=2)
+            json_data = json_bytes(df)
             st.download_button(
                 label="📥 Descargar JSON",
                 data=json_data,
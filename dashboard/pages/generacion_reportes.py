@@ -1,5 +1,6 @@
 from app.database.connection import SessionLocal
 from app.database.crud import FormularioCRUD
+from dashboard.components.data_version import get_data_version
 import streamlit as st
 import pandas as pd
 from datetime import datetime, date, timedelta
@@ -136,7 +137,7 @@ def show_report_generation_page():
 
     # Load data
     try:
-        all_forms, metrics = load_report_data()
+        all_forms, metrics = load_report_data(get_data_version())
     except Exception as e:
         st.error(f"Error al cargar datos: {e}")
         return
@@ -710,26 +711,18 @@ def show_teacher_detail_tab():
         if selected_teacher['formularios']:
             st.markdown("#### 📋 Resumen de Formularios")
 
-            forms_data = []
-            for form in selected_teacher['formularios']:
-                status_icon = {
-                    'APROBADO': '✅',
-                    'PENDIENTE': '⏳',
-                    'RECHAZADO': '❌'
-                }.get(form.estado.value, '❓')
-
-                forms_data.append({
-                    'ID': form.id,
-                    'Estado': f"{status_icon} {form.estado.value}",
-                    'Período': f"{form.año_academico} - {form.trimestre}",
-                    'Fecha Envío': form.fecha_envio.strftime('%d/%m/%Y') if form.fecha_envio else 'N/A',
-                    'Estado Revisión': 'Revisado' if form.revisado_por else 'Pendiente'
-                })
+            # Plain scalar tuples so the cached table builder hashes cheaply
+            forms_records = tuple(
+                (form.id, form.estado.value, form.año_academico, form.trimestre,
+                 form.fecha_envio, bool(form.revisado_por))
+                for form in selected_teacher['formularios']
+            )
 
             # Display forms table
-            import pandas as pd
-            df_forms = pd.DataFrame(forms_data)
-            st.dataframe(df_forms, width="stretch", hide_index=True)
+            df_forms = build_forms_summary_table(forms_records)
+            st.dataframe(df_forms, width="stretch", hide_index=True, column_config={
+                'Fecha Envío': st.column_config.DatetimeColumn('Fecha Envío', format="DD/MM/YYYY")
+            })
 
             # Detailed view for each form
             st.markdown("#### 🔍 Información Detallada por Formulario")
@@ -747,6 +740,30 @@ def show_teacher_detail_tab():
         db.close()
 
 
+STATUS_ICONS = {
+    'APROBADO': '✅',
+    'PENDIENTE': '⏳',
+    'RECHAZADO': '❌'
+}
+
+
+@st.cache_data(ttl=300)
+def build_forms_summary_table(forms_records):
+    """Build the per-teacher forms summary with column-wise operations"""
+    df = pd.DataFrame.from_records(list(forms_records), columns=[
+        'ID', 'estado', 'año', 'trimestre', 'fecha_envio', 'revisado'])
+
+    estado = df['estado']
+    return pd.DataFrame({
+        'ID': df['ID'],
+        'Estado': estado.map(STATUS_ICONS).fillna('❓') + ' ' + estado,
+        'Período': df['año'].astype(str) + ' - ' + df['trimestre'].astype(str),
+        # Kept as datetime64; formatted by st.column_config when displayed
+        'Fecha Envío': pd.to_datetime(df['fecha_envio']),
+        'Estado Revisión': df['revisado'].map({True: 'Revisado', False: 'Pendiente'})
+    })
+
+
 def show_form_details(form):
     """Show detailed information for a specific form"""
 
@@ -927,8 +944,8 @@ def show_form_details(form):
 
 
 @st.cache_data(ttl=60)  # Reduced cache time for more frequent updates
-def load_report_data():
-    """Load data for report generation with caching"""
+def load_report_data(version: int = 0):
+    """Load data for report generation with caching (keyed on the server-wide data version)"""
     db = SessionLocal()
     try:
         crud = FormularioCRUD(db)
@@ -9,6 +9,7 @@ from app.auth.streamlit_auth import auth
 from app.models.database import EstadoFormularioEnum
 from app.database.crud import FormularioCRUD
 from app.database.connection import SessionLocal
+from dashboard.components.data_version import bump_data_version
 import streamlit as st
 import sys
 import os
@@ -389,7 +390,7 @@ def show_form_review_page():
                 if st.button("✅ Aprobar", type="primary", key=f"approve_{selected_form['id']}"):
                     if approve_form(selected_form['id']):
                         st.success("Formulario aprobado exitosamente!")
-                        st.cache_data.clear()
+                        bump_data_version()
                         st.rerun()
                     else:
                         st.error("Error al aprobar el formulario.")
@@ -398,7 +399,7 @@ def show_form_review_page():
                 if st.button("🔄 Revertir a Pendiente", key=f"revert_{selected_form['id']}"):
                     if revert_to_pending(selected_form['id']):
                         st.success("Formulario revertido a pendiente!")
-                        st.cache_data.clear()
+                        bump_data_version()
                         st.rerun()
                     else:
                         st.error("Error al revertir el formulario.")
@@ -407,7 +408,7 @@ def show_form_review_page():
                 if st.button("🔄 Revertir a Pendiente", key=f"revert_rejected_{selected_form['id']}"):
                     if revert_to_pending(selected_form['id']):
                         st.success("Formulario revertido a pendiente!")
-                        st.cache_data.clear()
+                        bump_data_version()
                         st.rerun()
                     else:
                         st.error("Error al revertir el formulario.")
@@ -431,6 +432,7 @@ def show_form_review_page():
                     if st.button("✅ Confirmar", key=f"confirm_reject_{selected_form['id']}", type="primary"):
                         if reject_form(selected_form['id'], comment):
                             st.success("Formulario rechazado.")
+                            bump_data_version()
                             st.session_state[f"rejecting_{selected_form['id']}"] = False
                             st.rerun()
                         else:
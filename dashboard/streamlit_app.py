@@ -2,6 +2,10 @@
 import streamlit as st
 import sys
 import os
+import enum
+import threading
+from concurrent.futures import Future
+from datetime import datetime
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -11,8 +15,12 @@ from app.database.connection import SessionLocal
 from app.database.crud import FormularioCRUD
 from app.models.database import EstadoFormularioEnum
 from app.auth.streamlit_auth import auth
-from app.core.data_processor import DataProcessor
-from app.core.metrics_calculator import MetricsCalculator
+from app.core.error_handler import error_handler, ValidationError
+from app.core.logging_middleware import app_logger
+from app.core.validators import DatabaseValidator
+from app.core.simple_audit import simple_audit
+from dashboard.components.data_version import get_data_version, bump_data_version
+from dashboard.components.export_serializers import csv_bytes, excel_bytes, json_bytes
 
 # Lazy imports for better performance
 @st.cache_resource
@@ -24,8 +32,35 @@ def get_pandas():
 def get_plotly():
     import plotly.express as px
     import plotly.graph_objects as go
+    try:
+        from plotly_resampler import register_plotly_resampler
+    except ImportError:
+        pass
+    else:
+        # Long traces are downsampled to the visible range before reaching the browser
+        register_plotly_resampler(mode='auto')
     return px, go
 
+@st.cache_resource
+def get_formulario_main():
+    from dashboard.formulario import main
+    return main
+
+@st.cache_resource
+def get_backup_page():
+    from dashboard.pages.backup_restauracion import show_backup_restauracion_page
+    return show_backup_restauracion_page
+
+@st.cache_resource
+def get_processor_cls():
+    from app.core.data_processor import DataProcessor
+    return DataProcessor
+
+@st.cache_resource
+def get_calculator_cls():
+    from app.core.metrics_calculator import MetricsCalculator
+    return MetricsCalculator
+
 # Initialize app once
 if 'app_initialized' not in st.session_state:
     try:
@@ -45,56 +80,121 @@ st.set_page_config(
 )
 
 
-@st.cache_data(ttl=300)  # Cache for 5 minutes
+@st.cache_resource
+def get_estado_dtype():
+    pd = get_pandas()
+    return pd.CategoricalDtype(categories=[e.value for e in EstadoFormularioEnum])
+
+
+@st.cache_data(ttl=300)
+def load_forms_frame(limit: int = 50, version: int = 0):
+    """Load active forms as a DataFrame straight from SQL, skipping ORM hydration"""
+    from sqlalchemy import select, cast, String
+    from app.database.connection import engine
+    from app.models.database import FormularioEnvioDB
+
+    pd = get_pandas()
+    query = select(
+        FormularioEnvioDB.id,
+        FormularioEnvioDB.nombre_completo,
+        FormularioEnvioDB.correo_institucional,
+        cast(FormularioEnvioDB.estado, String).label('estado'),
+        FormularioEnvioDB.fecha_envio
+    ).where(
+        FormularioEnvioDB.es_version_activa == True
+    ).limit(limit)
+
+    with engine.connect().execution_options(stream_results=True) as conn:
+        df = pd.read_sql_query(query, conn)
+
+    # Low-cardinality status column: group and compare on int8 codes
+    df['estado'] = df['estado'].astype(get_estado_dtype())
+    return df
+
+
 def load_data():
-    """Load data from database with caching"""
-    db = SessionLocal()
-    try:
-        crud = FormularioCRUD(db)
+    """Load the forms DataFrame and dashboard metrics, plus the data version they belong to"""
+    version = get_data_version()
+    return load_forms_frame(version=version), load_metrics_only(version), version
 
-        # Get limited forms for better performance
-        all_forms = crud.get_all_formularios(
-            limit=50)  # Reduced from 1000 to 50
 
-        # Get metrics
-        metrics = crud.get_metricas_generales()
+@st.cache_data(ttl=300)
+def clean_data_cached(version: int, _forms_df):
+    """clean_data memoized on the data version the forms were loaded at"""
+    with SessionLocal() as db:
+        return get_processor_cls()(db).clean_data(_forms_df)
 
-        return all_forms, metrics
-    finally:
-        db.close()
 
+@st.cache_data(ttl=300)
+def detect_duplicates_cached(version: int, _df):
+    """Duplicate detection memoized on the data version"""
+    with SessionLocal() as db:
+        return get_processor_cls()(db).detect_duplicates(_df, return_indices=True)
+
+
+@st.cache_data(ttl=300)
+def generate_statistics_cached(version: int, _df):
+    """Statistics generation memoized on the data version"""
+    with SessionLocal() as db:
+        return get_processor_cls()(db).generate_statistics(_df)
+
+
+# Single-flight guard for the metrics aggregate: when the cache expires under
+# concurrent sessions only the first caller per version queries, the rest wait
+# on its Future. The lock only guards the in-flight map, never the query.
+_metrics_lock = threading.Lock()
+_metrics_inflight = {}  # version -> Future
+
+
+# Cache for 1 minute so the metric tiles refresh independently of the forms frame
+@st.cache_data(ttl=60)
+def load_metrics_only(version: int = 0):
+    """Load only metrics, keyed on the server-wide data version"""
+    with _metrics_lock:
+        future = _metrics_inflight.get(version)
+        owner = future is None
+        if owner:
+            future = _metrics_inflight[version] = Future()
+
+    if not owner:
+        return future.result()
 
-# Cache for 10 minutes (longer for less frequent changes)
-@st.cache_data(ttl=600)
-def load_metrics_only():
-    """Load only metrics with longer caching"""
-    db = SessionLocal()
     try:
-        crud = FormularioCRUD(db)
-        return crud.get_metricas_generales()
+        with SessionLocal() as db:
+            metrics = FormularioCRUD(db).get_metricas_generales()
+        future.set_result(metrics)
+        return metrics
+    except BaseException as e:
+        # Rerun/stop control flow is not an Exception; waiters must still be released
+        future.set_exception(e)
+        raise
     finally:
-        db.close()
+        with _metrics_lock:
+            _metrics_inflight.pop(version, None)
 
 
 # Cache for 1 minute (more frequent updates for pending forms)
 @st.cache_data(ttl=60)
-def get_pending_forms():
-    """Get pending forms for review"""
-    db = SessionLocal()
-    try:
+def get_pending_forms(version: int = 0):
+    """Get (id, nombre_completo) of pending forms for review, keyed on the data version"""
+    with SessionLocal() as db:
         crud = FormularioCRUD(db)
         # Reduced limit
-        return crud.get_formularios_by_estado(EstadoFormularioEnum.PENDIENTE, limit=20)
-    finally:
-        db.close()
+        rows = crud.get_formularios_summary(estado=EstadoFormularioEnum.PENDIENTE, limit=20)
+        return [(row.id, row.nombre_completo) for row in rows]
+
+
+# Plain dict copy per session, keyed on the data version like the pending list
+@st.cache_data(ttl=60)
+def get_formulario_full(form_id: int, version: int = 0):
+    """Load one form with all its sections in a single eager-load pass, as plain data"""
+    with SessionLocal() as db:
+        form = FormularioCRUD(db).get_formulario_full(form_id)
+        return form_review_data(form) if form is not None else None
 
 
 def approve_form(form_id: int):
     """Approve a form with comprehensive error handling"""
-    from app.core.error_handler import error_handler, DatabaseError, ValidationError
-    from app.core.logging_middleware import app_logger
-    from app.core.validators import DatabaseValidator
-
     # Validate input
     if not DatabaseValidator.validate_id(form_id):
         error_handler.log_error(
@@ -145,12 +245,12 @@ def approve_form(form_id: int):
         if success:
             # Log the approval action
             try:
-                from app.core.simple_audit import simple_audit
                 if user_info:
                     simple_audit.log_form_approval(
                         form_id=form_id,
                         form_owner=form.nombre_completo,
-                        approved_by=user_info["name"]
+                        approved_by=user_info["name"],
+                        deferred=True
                     )
 
                 app_logger.log_operation(
@@ -191,10 +291,6 @@ def approve_form(form_id: int):
 
 def reject_form(form_id: int, comment: str = ""):
     """Reject a form with comprehensive error handling"""
-    from app.core.error_handler import error_handler, DatabaseError, ValidationError
-    from app.core.logging_middleware import app_logger
-    from app.core.validators import DatabaseValidator
-
     # Validate input
     if not DatabaseValidator.validate_id(form_id):
         error_handler.log_error(
@@ -249,13 +345,13 @@ def reject_form(form_id: int, comment: str = ""):
         if success:
             # Log the rejection action
             try:
-                from app.core.simple_audit import simple_audit
                 if user_info:
                     simple_audit.log_form_rejection(
                         form_id=form_id,
                         form_owner=form.nombre_completo,
                         rejected_by=user_info["name"],
-                        reason=comment
+                        reason=comment,
+                        deferred=True
                     )
 
                 app_logger.log_operation(
@@ -330,19 +426,17 @@ def main():
 def show_public_form():
     """Show the public form for teachers"""
     # Import and show the public form
-    from dashboard.formulario import main as formulario_main
+    formulario_main = get_formulario_main()
     formulario_main()
 
 
 def show_admin_dashboard():
     """Show the admin dashboard"""
     # Initialize session state with persistence support
-    if 'authenticated' not in st.session_state:
-        st.session_state.authenticated = False
-    if 'session_id' not in st.session_state:
-        st.session_state.session_id = None
-    if 'user_info' not in st.session_state:
-        st.session_state.user_info = None
+    ss = st.session_state
+    ss.setdefault('authenticated', False)
+    ss.setdefault('session_id', None)
+    ss.setdefault('user_info', None)
 
     # Check authentication status first
     if not auth.is_authenticated():
@@ -443,8 +537,7 @@ def show_authenticated_dashboard():
         return
     
     if st.session_state.get('show_backup_page'):
-        from dashboard.pages.backup_restauracion import show_backup_restauracion_page
-        show_backup_restauracion_page()
+        get_backup_page()()
         if st.button("← Volver al Dashboard"):
             st.session_state.show_backup_page = False
             st.rerun()
@@ -453,7 +546,7 @@ def show_authenticated_dashboard():
     # Load data with optimized caching - always show main dashboard
     try:
         # For main dashboard, use cached metrics only for better performance
-        metrics = load_metrics_only()
+        metrics = load_metrics_only(get_data_version())
         all_forms = []  # Load forms only when needed
     except Exception as e:
         st.error(f"Error al cargar datos: {e}")
@@ -507,63 +600,141 @@ def show_main_dashboard(all_forms, metrics):
 
     with col1:
         # Status distribution pie chart
-        status_data = {
-            'Estado': ['Pendientes', 'Aprobados', 'Rechazados'],
-            'Cantidad': [
-                metrics.formularios_pendientes,
-                metrics.formularios_aprobados,
-                metrics.formularios_rechazados
-            ]
-        }
-
-        px, go = get_plotly()
-        fig_pie = px.pie(
-            values=status_data['Cantidad'],
-            names=status_data['Estado'],
-            title="Distribución por Estado",
-            color_discrete_map={
-                'Pendientes': '#ff9800',
-                'Aprobados': '#4caf50',
-                'Rechazados': '#f44336'
-            }
+        fig_pie = build_status_pie(
+            metrics.formularios_pendientes,
+            metrics.formularios_aprobados,
+            metrics.formularios_rechazados
         )
         st.plotly_chart(fig_pie, width="stretch")
 
     with col2:
         # Academic activities bar chart
-        activities_data = {
-            'Actividad': ['Cursos', 'Publicaciones', 'Eventos', 'Diseños', 'Movilidades', 'Reconocimientos', 'Certificaciones', 'Otras'],
-            'Cantidad': [
-                metrics.total_cursos,
-                metrics.total_publicaciones,
-                metrics.total_eventos,
-                metrics.total_disenos_curriculares,
-                metrics.total_movilidades,
-                metrics.total_reconocimientos,
-                metrics.total_certificaciones,
-                metrics.total_otras_actividades
-            ]
-        }
-
-        fig_bar = px.bar(
-            x=activities_data['Actividad'],
-            y=activities_data['Cantidad'],
-            title="Actividades Académicas (Aprobadas)",
-            color=activities_data['Cantidad'],
-            color_continuous_scale='Blues'
+        fig_bar = build_activities_bar(
+            metrics.total_cursos,
+            metrics.total_publicaciones,
+            metrics.total_eventos,
+            metrics.total_disenos_curriculares,
+            metrics.total_movilidades,
+            metrics.total_reconocimientos,
+            metrics.total_certificaciones,
+            metrics.total_otras_actividades
         )
-        fig_bar.update_layout(showlegend=False)
         st.plotly_chart(fig_bar, width="stretch")
 
 
+# Figures are keyed on the scalar counts, so reruns with unchanged metrics
+# reuse the built figure instead of going through plotly.express again
+@st.cache_data(ttl=600)
+def build_status_pie(pendientes: int, aprobados: int, rechazados: int):
+    """Status distribution pie chart"""
+    px, go = get_plotly()
+    fig = go.Figure(go.Pie(
+        labels=['Pendientes', 'Aprobados', 'Rechazados'],
+        values=[pendientes, aprobados, rechazados],
+        marker=dict(colors=['#ff9800', '#4caf50', '#f44336']),
+        sort=False
+    ))
+    fig.update_layout(title="Distribución por Estado")
+    return fig
+
+
+@st.cache_data(ttl=600)
+def build_activities_bar(cursos: int, publicaciones: int, eventos: int, disenos: int,
+                         movilidades: int, reconocimientos: int, certificaciones: int,
+                         otras: int):
+    """Academic activities bar chart"""
+    px, go = get_plotly()
+    cantidades = [cursos, publicaciones, eventos, disenos,
+                  movilidades, reconocimientos, certificaciones, otras]
+    fig = go.Figure(go.Bar(
+        x=['Cursos', 'Publicaciones', 'Eventos', 'Diseños', 'Movilidades',
+           'Reconocimientos', 'Certificaciones', 'Otras'],
+        y=cantidades,
+        marker=dict(color=cantidades, colorscale='Blues')
+    ))
+    fig.update_layout(title="Actividades Académicas (Aprobadas)", showlegend=False)
+    return fig
+
+
+def mark_form_reviewed(form_id: int):
+    """Hide a form this session just reviewed until the pending list reloads without it"""
+    st.session_state.setdefault('reviewed_form_ids', set()).add(form_id)
+    # Only the version-keyed loaders depend on review state; they miss on the next run
+    bump_data_version()
+    st.session_state.reviewed_at_version = get_data_version()
+
+
+# Form review tabs: (label, relationship, {column: attribute}, empty message)
+REVIEW_SECTIONS = [
+    ("Cursos", 'cursos_capacitacion',
+     {'Nombre': 'nombre_curso', 'Fecha': 'fecha', 'Horas': 'horas'},
+     "No hay cursos registrados."),
+    ("Publicaciones", 'publicaciones',
+     {'Autores': 'autores', 'Título': 'titulo', 'Evento/Revista': 'evento_revista',
+      'Estatus': 'estatus'},
+     "No hay publicaciones registradas."),
+    ("Eventos", 'eventos_academicos',
+     {'Nombre': 'nombre_evento', 'Fecha': 'fecha', 'Tipo de participación': 'tipo_participacion'},
+     "No hay eventos registrados."),
+    ("Diseño Curricular", 'diseno_curricular',
+     {'Curso': 'nombre_curso', 'Descripción': 'descripcion'},
+     "No hay diseños curriculares registrados."),
+    ("Movilidad", 'movilidad',
+     {'Descripción': 'descripcion', 'Tipo': 'tipo', 'Fecha': 'fecha'},
+     "No hay experiencias de movilidad registradas."),
+    ("Reconocimientos", 'reconocimientos',
+     {'Nombre': 'nombre', 'Tipo': 'tipo', 'Fecha': 'fecha'},
+     "No hay reconocimientos registrados."),
+    ("Certificaciones", 'certificaciones',
+     {'Nombre': 'nombre', 'Fecha obtención': 'fecha_obtencion'},
+     "No hay certificaciones registradas.")
+]
+
+
+def plain_value(value):
+    """Enum members become their values so cached form data is plain"""
+    return value.value if isinstance(value, enum.Enum) else value
+
+
+def form_review_data(form) -> dict:
+    """Copy the fields and sections the review page shows out of the ORM graph"""
+    data = {
+        field: plain_value(getattr(form, field))
+        for field in ('id', 'nombre_completo', 'correo_institucional', 'año_academico',
+                      'trimestre', 'estado', 'fecha_envio', 'fecha_revision', 'revisado_por')
+    }
+    for _, relationship, fields, _ in REVIEW_SECTIONS:
+        data[relationship] = [
+            {attr: plain_value(getattr(item, attr)) for attr in fields.values()}
+            for item in getattr(form, relationship)
+        ]
+    return data
+
+
+def section_frame(items, fields):
+    """Tabulate one form section from its plain row dicts"""
+    pd = get_pandas()
+    return pd.DataFrame.from_records(
+        [tuple(item[attr] for attr in fields.values()) for item in items],
+        columns=list(fields))
+
+
 def show_form_review():
     """Show form review interface"""
 
     st.header("📋 Revisión de Formularios")
 
-    # Get pending forms
+    # Reloaded when the cache expires or the data version changes; forms this
+    # session already reviewed are hidden while a cached list still has them
+    version = get_data_version()
+    if st.session_state.get('reviewed_at_version') != version:
+        # Another change since our last review: the reloaded list is authoritative
+        st.session_state.reviewed_form_ids = set()
     try:
-        pending_forms = get_pending_forms()
+        reviewed = st.session_state.get('reviewed_form_ids', set())
+        pending_forms = [
+            (form_id, nombre) for form_id, nombre in get_pending_forms(version)
+            if form_id not in reviewed]
     except Exception as e:
         st.error(f"Error al cargar formularios pendientes: {e}")
         return
@@ -574,152 +745,101 @@ def show_form_review():
 
     st.info(f"Hay {len(pending_forms)} formularios pendientes de revisión.")
 
-    # Form selection
-    form_options = {
-        f"ID {form.id} - {form.nombre_completo}": form for form in pending_forms}
-    selected_form_key = st.selectbox(
-        "Seleccionar formulario para revisar:", list(form_options.keys()))
+    # Form selection by id; the full form is only loaded for the chosen one
+    form_names = dict(pending_forms)
+    selected_form_id = st.selectbox(
+        "Seleccionar formulario para revisar:", list(form_names),
+        format_func=lambda form_id: f"ID {form_id} - {form_names[form_id]}")
 
-    if selected_form_key:
-        selected_form = form_options[selected_form_key]
+    if selected_form_id is not None:
+        # Sections are read from an eagerly loaded copy, not lazy relationships
+        selected_form = get_formulario_full(selected_form_id, version)
+        if selected_form is None:
+            st.error("No se pudo cargar el formulario seleccionado.")
+            return
 
         # Display form details
-        st.subheader(f"📄 Detalles del Formulario ID: {selected_form.id}")
+        st.subheader(f"📄 Detalles del Formulario ID: {selected_form['id']}")
 
         col1, col2 = st.columns(2)
 
+        # One markdown block per column instead of one st.write per line
         with col1:
-            st.write("**Información Personal:**")
-            st.write(f"- **Nombre:** {selected_form.nombre_completo}")
-            st.write(f"- **Email:** {selected_form.correo_institucional}")
-            st.write(f"- **Período:** {selected_form.año_academico} - {selected_form.trimestre}" if hasattr(
-                selected_form, 'año_academico') else "- **Período:** N/A")
-            st.write(
-                f"- **Fecha de envío:** {selected_form.fecha_envio.strftime('%Y-%m-%d %H:%M')}")
+            st.markdown("\n".join([
+                "**Información Personal:**",
+                f"- **Nombre:** {selected_form['nombre_completo']}",
+                f"- **Email:** {selected_form['correo_institucional']}",
+                f"- **Período:** {selected_form['año_academico']} - {selected_form['trimestre']}",
+                f"- **Fecha de envío:** {selected_form['fecha_envio'].strftime('%Y-%m-%d %H:%M')}"
+            ]))
 
         with col2:
-            st.write("**Estado:**")
-            st.write(f"- **Estado actual:** {selected_form.estado.value}")
-            if selected_form.fecha_revision:
-                st.write(
-                    f"- **Fecha revisión:** {selected_form.fecha_revision.strftime('%Y-%m-%d %H:%M')}")
-            if selected_form.revisado_por:
-                st.write(f"- **Estado:** Revisado")
+            lines = ["**Estado:**",
+                     f"- **Estado actual:** {selected_form['estado']}"]
+            if selected_form['fecha_revision']:
+                lines.append(
+                    f"- **Fecha revisión:** {selected_form['fecha_revision'].strftime('%Y-%m-%d %H:%M')}")
+            if selected_form['revisado_por']:
+                lines.append("- **Estado:** Revisado")
+            st.markdown("\n".join(lines))
 
         # Show related data
         st.subheader("📚 Contenido del Formulario")
 
-        # Create tabs for different sections
-        tabs = st.tabs(["Cursos", "Publicaciones", "Eventos", "Diseño Curricular",
-                       "Movilidad", "Reconocimientos", "Certificaciones"])
-
-        with tabs[0]:  # Cursos
-            if selected_form.cursos_capacitacion:
-                for i, curso in enumerate(selected_form.cursos_capacitacion, 1):
-                    st.write(f"**Curso {i}:**")
-                    st.write(f"- Nombre: {curso.nombre_curso}")
-                    st.write(f"- Fecha: {curso.fecha}")
-                    st.write(f"- Horas: {curso.horas}")
-                    st.write("---")
-            else:
-                st.info("No hay cursos registrados.")
-
-        with tabs[1]:  # Publicaciones
-            if selected_form.publicaciones:
-                for i, pub in enumerate(selected_form.publicaciones, 1):
-                    st.write(f"**Publicación {i}:**")
-                    st.write(f"- Autores: {pub.autores}")
-                    st.write(f"- Título: {pub.titulo}")
-                    st.write(f"- Evento/Revista: {pub.evento_revista}")
-                    st.write(f"- Estatus: {pub.estatus.value}")
-                    st.write("---")
-            else:
-                st.info("No hay publicaciones registradas.")
-
-        with tabs[2]:  # Eventos
-            if selected_form.eventos_academicos:
-                for i, evento in enumerate(selected_form.eventos_academicos, 1):
-                    st.write(f"**Evento {i}:**")
-                    st.write(f"- Nombre: {evento.nombre_evento}")
-                    st.write(f"- Fecha: {evento.fecha}")
-                    st.write(
-                        f"- Tipo de participación: {evento.tipo_participacion.value}")
-                    st.write("---")
-            else:
-                st.info("No hay eventos registrados.")
-
-        with tabs[3]:  # Diseño Curricular
-            if selected_form.diseno_curricular:
-                for i, diseno in enumerate(selected_form.diseno_curricular, 1):
-                    st.write(f"**Diseño {i}:**")
-                    st.write(f"- Curso: {diseno.nombre_curso}")
-                    if diseno.descripcion:
-                        st.write(f"- Descripción: {diseno.descripcion}")
-                    st.write("---")
-            else:
-                st.info("No hay diseños curriculares registrados.")
-
-        with tabs[4]:  # Movilidad
-            if selected_form.movilidad:
-                for i, mov in enumerate(selected_form.movilidad, 1):
-                    st.write(f"**Movilidad {i}:**")
-                    st.write(f"- Descripción: {mov.descripcion}")
-                    st.write(f"- Tipo: {mov.tipo.value}")
-                    st.write(f"- Fecha: {mov.fecha}")
-                    st.write("---")
-            else:
-                st.info("No hay experiencias de movilidad registradas.")
-
-        with tabs[5]:  # Reconocimientos
-            if selected_form.reconocimientos:
-                for i, rec in enumerate(selected_form.reconocimientos, 1):
-                    st.write(f"**Reconocimiento {i}:**")
-                    st.write(f"- Nombre: {rec.nombre}")
-                    st.write(f"- Tipo: {rec.tipo.value}")
-                    st.write(f"- Fecha: {rec.fecha}")
-                    st.write("---")
-            else:
-                st.info("No hay reconocimientos registrados.")
-
-        with tabs[6]:  # Certificaciones
-            if selected_form.certificaciones:
-                for i, cert in enumerate(selected_form.certificaciones, 1):
-                    st.write(f"**Certificación {i}:**")
-                    st.write(f"- Nombre: {cert.nombre}")
-                    st.write(f"- Fecha obtención: {cert.fecha_obtencion}")
-                    st.write("---")
-            else:
-                st.info("No hay certificaciones registradas.")
+        # One dataframe per tab instead of one st.write per field
+        tabs = st.tabs([label for label, _, _, _ in REVIEW_SECTIONS])
+
+        for tab, (_, relationship, fields, empty_message) in zip(tabs, REVIEW_SECTIONS):
+            with tab:
+                items = selected_form[relationship]
+                if not items:
+                    st.info(empty_message)
+                    continue
+                st.dataframe(section_frame(items, fields), width="stretch", hide_index=True)
 
         # Action buttons
         st.subheader("⚡ Acciones")
+        show_review_actions(selected_form['id'])
 
-        col1, col2, col3 = st.columns([1, 1, 2])
 
-        with col1:
-            if st.button("✅ Aprobar", type="primary", key=f"approve_{selected_form.id}"):
-                if approve_form(selected_form.id):
-                    st.success("Formulario aprobado exitosamente!")
-                    st.cache_data.clear()  # Clear cache to refresh data
-                    st.rerun()
-                else:
-                    st.error("Error al aprobar el formulario.")
+@st.fragment
+def show_review_actions(form_id: int):
+    """Approve/reject controls; a click reruns only this fragment, not the page"""
+    if form_id in st.session_state.get('reviewed_form_ids', set()):
+        st.info("Este formulario ya fue revisado.")
+        return
 
-        with col2:
-            if st.button("❌ Rechazar", key=f"reject_{selected_form.id}"):
-                comment = st.text_area(
-                    "Comentario (opcional):", key=f"comment_{selected_form.id}")
-                if st.button("Confirmar Rechazo", key=f"confirm_reject_{selected_form.id}"):
-                    if reject_form(selected_form.id, comment):
-                        st.success("Formulario rechazado.")
-                        st.cache_data.clear()
-                        st.rerun()
-                    else:
-                        st.error("Error al rechazar el formulario.")
+    col1, col2, col3 = st.columns([1, 1, 2])
 
+    with col1:
+        if st.button("✅ Aprobar", type="primary", key=f"approve_{form_id}"):
+            if approve_form(form_id):
+                mark_form_reviewed(form_id)
+                st.toast("Formulario aprobado exitosamente!", icon="✅")
+                st.info("Este formulario ya fue revisado.")
+            else:
+                st.error("Error al aprobar el formulario.")
 
-def show_detailed_metrics(all_forms, metrics):
-    """Show detailed metrics and analytics"""
+    with col2:
+        # The confirmation lives in its own rerun, so remember the open state
+        rejecting_key = f"rejecting_{form_id}"
+        if st.button("❌ Rechazar", key=f"reject_{form_id}"):
+            st.session_state[rejecting_key] = True
+
+        if st.session_state.get(rejecting_key):
+            comment = st.text_area(
+                "Comentario (opcional):", key=f"comment_{form_id}")
+            if st.button("Confirmar Rechazo", key=f"confirm_reject_{form_id}"):
+                if reject_form(form_id, comment):
+                    st.session_state[rejecting_key] = False
+                    mark_form_reviewed(form_id)
+                    st.toast("Formulario rechazado.", icon="❌")
+                else:
+                    st.error("Error al rechazar el formulario.")
+
+
+def show_detailed_metrics(forms_df, metrics, version: int):
+    """Show detailed metrics and analytics for forms loaded at a data version"""
 
     st.header("📊 Métricas Detalladas")
 
@@ -733,246 +853,342 @@ def show_detailed_metrics(all_forms, metrics):
         quarter = st.selectbox("Trimestre (opcional):", [
                                "Todos", "Q1", "Q2", "Q3", "Q4"])
 
-    # Process data
-    db = SessionLocal()
-    try:
-        processor = DataProcessor(db)
-        calculator = MetricsCalculator(db)
-
-        # Convert forms to DataFrame
-        if all_forms:
-            raw_data = []
-            for form in all_forms:
-                raw_data.append({
-                    'id': form.id,
-                    'nombre_completo': form.nombre_completo,
-                    'correo_institucional': form.correo_institucional,
-                    'estado': form.estado.value,
-                    'fecha_envio': form.fecha_envio,
-                    'year': form.fecha_envio.year if form.fecha_envio else None,
-                    'quarter': (form.fecha_envio.month - 1) // 3 + 1 if form.fecha_envio else None
-                })
-
-            df = processor.clean_data(raw_data)
-
-            # Calculate metrics based on selection
-            if quarter != "Todos":
-                quarter_num = int(quarter[1])
-                period_metrics = calculator.calculate_quarterly_metrics(
-                    df, quarter_num, year)
-                st.subheader(f"📈 Métricas para {quarter} {year}")
-            else:
-                period_metrics = calculator.calculate_annual_metrics(df, year)
-                st.subheader(f"📈 Métricas Anuales {year}")
+    # Forms already arrive as a DataFrame (see load_forms_frame)
+    if forms_df is None or forms_df.empty:
+        st.info("No hay datos disponibles para el análisis.")
+        return
 
-            # Display metrics
-            col1, col2 = st.columns(2)
+    # Cleaning is reused across year/quarter changes for the same snapshot
+    df = clean_data_cached(version, forms_df)
 
-            with col1:
-                st.metric("Formularios Procesados", period_metrics.get(
-                    'formularios_procesados', 0))
+    # Process data - hold the session only while the metrics are queried
+    with SessionLocal() as db:
+        calculator = get_calculator_cls()(db)
 
-                # Show activity summary if available
-                if 'resumen_actividades' in period_metrics:
-                    st.write("**Resumen de Actividades:**")
-                    resumen = period_metrics['resumen_actividades']
+        # Calculate metrics based on selection
+        if quarter != "Todos":
+            quarter_num = int(quarter[1])
+            period_metrics = calculator.calculate_quarterly_metrics(
+                df, quarter_num, year)
+        else:
+            period_metrics = calculator.calculate_annual_metrics(df, year)
 
-                    if 'capacitacion' in resumen:
-                        cap = resumen['capacitacion']
-                        st.write(
-                            f"- Cursos: {cap.get('total_cursos', 0)} ({cap.get('total_horas', 0)} horas)")
+    if quarter != "Todos":
+        st.subheader(f"📈 Métricas para {quarter} {year}")
+    else:
+        st.subheader(f"📈 Métricas Anuales {year}")
 
-                    if 'investigacion' in resumen:
-                        inv = resumen['investigacion']
-                        st.write(
-                            f"- Publicaciones: {inv.get('total_publicaciones', 0)}")
+    # Display metrics
+    col1, col2 = st.columns(2)
 
-                    if 'eventos_academicos' in resumen:
-                        evt = resumen['eventos_academicos']
-                        st.write(f"- Eventos: {evt.get('total_eventos', 0)}")
+    with col1:
+        st.metric("Formularios Procesados", period_metrics.get(
+            'formularios_procesados', 0))
 
-            with col2:
-                # Show highlights if available
-                if 'destacados' in period_metrics:
-                    st.write("**Destacados:**")
-                    for highlight in period_metrics['destacados']:
-                        st.write(f"- {highlight}")
-
-                # Show comparison if available
-                if 'comparacion_anterior' in period_metrics:
-                    st.write("**Comparación con período anterior:**")
-                    comp = period_metrics['comparacion_anterior']
-                    if 'cambios' in comp:
-                        for activity, change in comp['cambios'].items():
-                            if change > 0:
-                                st.write(f"- {activity}: +{change}% 📈")
-                            elif change < 0:
-                                st.write(f"- {activity}: {change}% 📉")
-                            else:
-                                st.write(f"- {activity}: Sin cambios ➡️")
+        # Show activity summary if available
+        if 'resumen_actividades' in period_metrics:
+            st.write("**Resumen de Actividades:**")
+            resumen = period_metrics['resumen_actividades']
 
-        else:
-            st.info("No hay datos disponibles para el análisis.")
+            if 'capacitacion' in resumen:
+                cap = resumen['capacitacion']
+                st.write(
+                    f"- Cursos: {cap.get('total_cursos', 0)} ({cap.get('total_horas', 0)} horas)")
 
-    finally:
-        db.close()
+            if 'investigacion' in resumen:
+                inv = resumen['investigacion']
+                st.write(
+                    f"- Publicaciones: {inv.get('total_publicaciones', 0)}")
+
+            if 'eventos_academicos' in resumen:
+                evt = resumen['eventos_academicos']
+                st.write(f"- Eventos: {evt.get('total_eventos', 0)}")
+
+    with col2:
+        # Show highlights if available
+        if 'destacados' in period_metrics:
+            st.write("**Destacados:**")
+            for highlight in period_metrics['destacados']:
+                st.write(f"- {highlight}")
+
+        # Show comparison if available
+        if 'comparacion_anterior' in period_metrics:
+            st.write("**Comparación con período anterior:**")
+            comp = period_metrics['comparacion_anterior']
+            if 'cambios' in comp:
+                for activity, change in comp['cambios'].items():
+                    if change > 0:
+                        st.write(f"- {activity}: +{change}% 📈")
+                    elif change < 0:
+                        st.write(f"- {activity}: {change}% 📉")
+                    else:
+                        st.write(f"- {activity}: Sin cambios ➡️")
+
+
+# Upper bound on rows sent to the browser for table previews
+PREVIEW_MAX_ROWS = 500
+
+
+def arrow_preview(df, max_rows: int = PREVIEW_MAX_ROWS):
+    """Cap a preview DataFrame and convert it to Arrow once for st.dataframe"""
+    import pyarrow as pa
+    return pa.Table.from_pandas(df.head(max_rows), preserve_index=False)
 
 
-def show_data_analysis(all_forms):
-    """Show advanced data analysis"""
+def monthly_period(df):
+    """First-of-month timestamps from integer year/month columns"""
+    pd = get_pandas()
+    return pd.to_datetime(
+        df[['year', 'month']].astype(int).assign(day=1)).rename('period')
+
+
+@st.cache_data(ttl=300)
+def load_monthly_counts(version: int = 0):
+    """Monthly submission counts, grouped by the database, keyed on the data version"""
+    pd = get_pandas()
+    with SessionLocal() as db:
+        rows = FormularioCRUD(db).get_monthly_counts()
+
+    df = pd.DataFrame.from_records(rows, columns=['year', 'month', 'count'])
+    return pd.DataFrame({'period': monthly_period(df), 'count': df['count']})
+
+
+@st.cache_data(ttl=300)
+def load_monthly_status_counts(version: int = 0):
+    """Monthly counts per status, grouped by the database, keyed on the data version"""
+    pd = get_pandas()
+    with SessionLocal() as db:
+        rows = FormularioCRUD(db).get_monthly_status_counts()
+
+    df = pd.DataFrame.from_records(rows, columns=['year', 'month', 'estado', 'count'])
+    return pd.DataFrame({
+        'period': monthly_period(df),
+        'estado': df['estado'].map(lambda e: e.value).astype(get_estado_dtype()),
+        'count': df['count']
+    })
+
+
+def show_data_analysis(forms_df, version: int):
+    """Show advanced data analysis for forms loaded at a data version"""
 
     st.header("🔍 Análisis de Datos")
 
-    if not all_forms:
+    if forms_df is None or forms_df.empty:
         st.info("No hay datos disponibles para análisis.")
         return
 
-    # Data processing
-    db = SessionLocal()
-    try:
-        processor = DataProcessor(db)
-
-        # Convert to DataFrame
-        raw_data = []
-        for form in all_forms:
-            raw_data.append({
-                'id': form.id,
-                'nombre_completo': form.nombre_completo,
-                'correo_institucional': form.correo_institucional,
-                'estado': form.estado.value,
-                'fecha_envio': form.fecha_envio,
-                'year': form.fecha_envio.year if form.fecha_envio else None,
-                'month': form.fecha_envio.month if form.fecha_envio else None
-            })
-
-        df = processor.clean_data(raw_data)
-        df_with_duplicates = processor.detect_duplicates(df)
-
-        # Analysis tabs
-        tab1, tab2, tab3 = st.tabs(
-            ["Tendencias Temporales", "Calidad de Datos", "Estadísticas Generales"])
-
-        with tab1:
-            st.subheader("📈 Tendencias Temporales")
-
-            if 'month' in df.columns and 'year' in df.columns:
-                # Monthly submissions chart
-                monthly_counts = df.groupby(
-                    ['year', 'month']).size().reset_index(name='count')
-                monthly_counts['period'] = monthly_counts['year'].astype(
-                    str) + '-' + monthly_counts['month'].astype(str).str.zfill(2)
-
-                fig_trend = px.line(
-                    monthly_counts,
-                    x='period',
-                    y='count',
-                    title='Formularios Enviados por Mes',
-                    markers=True
+    # Cleaning, duplicates and statistics are reused across reruns for the same data
+    df = clean_data_cached(version, forms_df)
+
+    # Analysis views - only the selected one is computed and rendered
+    vista = st.radio(
+        "Vista:", ["Tendencias Temporales", "Calidad de Datos", "Estadísticas Generales"],
+        horizontal=True, key="data_analysis_view")
+
+    if vista == "Tendencias Temporales":
+        st.subheader("📈 Tendencias Temporales")
+
+        if 'month' in df.columns and 'year' in df.columns:
+            # Plotly is only needed once a chart is actually drawn
+            px, go = get_plotly()
+
+            # Monthly submissions chart (aggregated in SQL)
+            monthly_counts = load_monthly_counts(get_data_version())
+
+            # Plain ndarrays keep the resampler (when installed) on its fast path
+            fig_trend = px.line(
+                x=monthly_counts['period'].to_numpy(),
+                y=monthly_counts['count'].to_numpy(),
+                title='Formularios Enviados por Mes',
+                markers=True
+            )
+            fig_trend.update_layout(
+                xaxis_title="Período", yaxis_title="Cantidad de Formularios")
+            st.plotly_chart(fig_trend, width="stretch")
+
+            # Status distribution over time
+            if 'estado' in df.columns:
+                status_time = load_monthly_status_counts(get_data_version())
+
+                fig_status = px.bar(
+                    x=status_time['period'].to_numpy(),
+                    y=status_time['count'].to_numpy(),
+                    color=status_time['estado'].astype(str).to_numpy(),
+                    labels={'x': 'period', 'y': 'count', 'color': 'estado'},
+                    title='Distribución de Estados por Mes',
+                    color_discrete_map={
+                        'PENDIENTE': '#ff9800',
+                        'APROBADO': '#4caf50',
+                        'RECHAZADO': '#f44336'
+                    }
                 )
-                fig_trend.update_layout(
-                    xaxis_title="Período", yaxis_title="Cantidad de Formularios")
-                st.plotly_chart(fig_trend, width="stretch")
-
-                # Status distribution over time
-                if 'estado' in df.columns:
-                    status_time = df.groupby(
-                        ['year', 'month', 'estado']).size().reset_index(name='count')
-                    status_time['period'] = status_time['year'].astype(
-                        str) + '-' + status_time['month'].astype(str).str.zfill(2)
-
-                    fig_status = px.bar(
-                        status_time,
-                        x='period',
-                        y='count',
-                        color='estado',
-                        title='Distribución de Estados por Mes',
-                        color_discrete_map={
-                            'PENDIENTE': '#ff9800',
-                            'APROBADO': '#4caf50',
-                            'RECHAZADO': '#f44336'
-                        }
-                    )
-                    st.plotly_chart(fig_status, width="stretch")
-
-        with tab2:
-            st.subheader("🔍 Calidad de Datos")
-
-            # Duplicate detection results
-            if 'is_duplicate' in df_with_duplicates.columns:
-                duplicates_count = df_with_duplicates['is_duplicate'].sum()
-                st.metric("Posibles Duplicados Detectados", duplicates_count)
-
-                if duplicates_count > 0:
-                    st.warning(
-                        f"Se detectaron {duplicates_count} posibles registros duplicados.")
-
-                    # Show duplicate groups
-                    duplicate_records = df_with_duplicates[df_with_duplicates['is_duplicate'] == True]
-                    if not duplicate_records.empty:
-                        st.write("**Registros Duplicados:**")
-                        st.dataframe(duplicate_records[[
-                                     'id', 'nombre_completo', 'correo_institucional', 'duplicate_group']])
-                else:
-                    st.success("No se detectaron duplicados.")
-
-            # Data completeness
-            st.write("**Completitud de Datos:**")
-            completeness = {}
-            for col in ['nombre_completo', 'correo_institucional']:
-                if col in df.columns:
-                    non_null = df[col].notna().sum()
-                    total = len(df)
-                    completeness[col] = (non_null / total) * \
-                        100 if total > 0 else 0
-
-            for field, percentage in completeness.items():
-                st.progress(percentage / 100,
-                            text=f"{field}: {percentage:.1f}%")
-
-        with tab3:
-            st.subheader("📊 Estadísticas Generales")
-
-            # Generate statistics
-            try:
-                stats = processor.generate_statistics(df)
-
-                if 'resumen_general' in stats:
-                    resumen = stats['resumen_general']
-
-                    col1, col2 = st.columns(2)
-
-                    with col1:
-                        st.write("**Resumen General:**")
-                        st.write(
-                            f"- Total registros: {resumen.get('total_registros', 0)}")
-                        if resumen.get('periodo_inicio'):
-                            st.write(
-                                f"- Período inicio: {resumen['periodo_inicio'][:10]}")
-                        if resumen.get('periodo_fin'):
-                            st.write(
-                                f"- Período fin: {resumen['periodo_fin'][:10]}")
-                        st.write(
-                            f"- Promedio mensual: {resumen.get('promedio_mensual', 0):.1f}")
-
-                    with col2:
-                        if 'estados_distribucion' in resumen:
-                            st.write("**Distribución por Estado:**")
-                            for estado, count in resumen['estados_distribucion'].items():
-                                st.write(f"- {estado}: {count}")
-
-                if 'calidad_datos' in stats:
-                    st.write("**Calidad de Datos:**")
-                    calidad = stats['calidad_datos']
-                    for field, metrics in calidad.items():
-                        if isinstance(metrics, dict):
-                            st.write(
-                                f"- {field}: {metrics.get('completitud', 0):.1f}% completo")
+                st.plotly_chart(fig_status, width="stretch")
+
+    elif vista == "Calidad de Datos":
+        st.subheader("🔍 Calidad de Datos")
+        df_with_duplicates, dup_idx = detect_duplicates_cached(version, df)
+
+        # Duplicate detection results
+        if 'is_duplicate' in df_with_duplicates.columns:
+            import numpy as np
+            duplicates_count = dup_idx.size
+            st.metric("Posibles Duplicados Detectados", duplicates_count)
+
+            if duplicates_count > 0:
+                st.warning(
+                    f"Se detectaron {duplicates_count} posibles registros duplicados.")
+
+                # Show duplicate groups
+                duplicate_records = df_with_duplicates.iloc[dup_idx]
+                if not duplicate_records.empty:
+                    # Group sizes straight from the integer group ids (C-level bincount)
+                    group_ids = duplicate_records['duplicate_group'].to_numpy(dtype=np.int64)
+                    group_sizes = np.bincount(group_ids)
+                    st.write(f"**Grupos de duplicados:** {np.count_nonzero(group_sizes)}")
+
+                    # Largest groups first in the preview
+                    order = np.argsort(-group_sizes[group_ids], kind='stable')
+                    duplicate_records = duplicate_records.iloc[order]
+
+                    st.write("**Registros Duplicados:**")
+                    st.dataframe(arrow_preview(duplicate_records[[
+                                 'id', 'nombre_completo', 'correo_institucional', 'duplicate_group']]),
+                                 width="stretch")
+            else:
+                st.success("No se detectaron duplicados.")
 
-            except Exception as e:
-                st.error(f"Error al generar estadísticas: {e}")
+        # Data completeness
+        st.write("**Completitud de Datos:**")
+        completeness_cols = [col for col in ['nombre_completo', 'correo_institucional']
+                             if col in df.columns]
+        completeness = df[completeness_cols].notna().mean() * 100
 
-    finally:
-        db.close()
+        # Every field's completeness in one chart element
+        st.bar_chart(completeness.rename('Completitud (%)'))
+
+    else:
+        st.subheader("📊 Estadísticas Generales")
+
+        try:
+            stats = generate_statistics_cached(version, df)
+        except Exception as e:
+            stats = {}
+            st.error(f"Error al generar estadísticas: {e}")
+
+        if 'resumen_general' in stats:
+            resumen = stats['resumen_general']
+
+            col1, col2 = st.columns(2)
+
+            # One markdown block per section instead of one st.write per line
+            with col1:
+                lines = ["**Resumen General:**",
+                         f"- Total registros: {resumen.get('total_registros', 0)}"]
+                if resumen.get('periodo_inicio'):
+                    lines.append(
+                        f"- Período inicio: {resumen['periodo_inicio'][:10]}")
+                if resumen.get('periodo_fin'):
+                    lines.append(
+                        f"- Período fin: {resumen['periodo_fin'][:10]}")
+                lines.append(
+                    f"- Promedio mensual: {resumen.get('promedio_mensual', 0):.1f}")
+                st.markdown("\n".join(lines))
+
+            with col2:
+                if 'estados_distribucion' in resumen:
+                    lines = ["**Distribución por Estado:**"]
+                    lines.extend(f"- {estado}: {count}"
+                                 for estado, count in resumen['estados_distribucion'].items())
+                    st.markdown("\n".join(lines))
+
+        if 'calidad_datos' in stats:
+            calidad = stats['calidad_datos']
+            lines = ["**Calidad de Datos:**"]
+            lines.extend(f"- {field}: {metrics.get('completitud', 0):.1f}% completo"
+                         for field, metrics in calidad.items() if isinstance(metrics, dict))
+            st.markdown("\n".join(lines))
+
+
+@st.cache_data(ttl=300)
+def load_export_forms(status_filter: str, version: int = 0, limit: int = 1000):
+    """Load active form summaries for export, keyed on the data version"""
+    estado = None if status_filter == "Todos" else EstadoFormularioEnum(status_filter)
+    with SessionLocal() as db:
+        return FormularioCRUD(db).get_formularios_summary(estado=estado, limit=limit)
+
+
+# Export format -> (serializer, file extension, mime type)
+EXPORT_FORMATS = {
+    "CSV": (csv_bytes, "csv", "text/csv"),
+    "Excel": (excel_bytes, "xlsx",
+              "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "JSON": (json_bytes, "json", "application/json")
+}
+
+
+# Export date columns -> source attribute on the form summary
+EXPORT_DATE_COLUMNS = {
+    'Fecha Envío': 'fecha_envio',
+    'Fecha Revisión': 'fecha_revision'
+}
+
+
+@st.cache_data(ttl=300)
+def build_export_frame(status_filter: str, version: int):
+    """Build the export DataFrame for a status filter (memoized per data version)"""
+    import numpy as np
+    pd = get_pandas()
+    filtered_forms = load_export_forms(status_filter, version)
+
+    # Prepare data for export column-wise (no per-row dicts)
+    n = len(filtered_forms)
+    text_columns = ['ID', 'Nombre Completo', 'Correo Institucional', 'Estado',
+                    'Fecha Envío', 'Fecha Revisión', 'Estado Revisión']
+    count_columns = {
+        'Cursos': 'cursos_capacitacion',
+        'Publicaciones': 'publicaciones',
+        'Eventos': 'eventos_academicos',
+        'Diseños Curriculares': 'diseno_curricular',
+        'Movilidades': 'movilidad',
+        'Reconocimientos': 'reconocimientos',
+        'Certificaciones': 'certificaciones'
+    }
+    columns = {name: np.empty(n, dtype=object) for name in text_columns}
+    columns.update({name: np.zeros(n, dtype=np.int32) for name in count_columns})
+
+    # Relationship counts come from GROUP BY queries, not lazy collections
+    with SessionLocal() as db:
+        conteos = FormularioCRUD(db).get_conteos_actividades(
+            [form.id for form in filtered_forms])
+
+    for i, form in enumerate(filtered_forms):
+        columns['ID'][i] = form.id
+        columns['Nombre Completo'][i] = form.nombre_completo
+        columns['Correo Institucional'][i] = form.correo_institucional
+        columns['Estado'][i] = form.estado.value
+        columns['Estado Revisión'][i] = 'Revisado' if form.revisado_por else 'Pendiente'
+        for name, relationship in count_columns.items():
+            columns[name][i] = conteos[relationship].get(form.id, 0)
+
+    # Dates stay datetime64; they are only rendered as text for the files
+    for name, attr in EXPORT_DATE_COLUMNS.items():
+        columns[name] = pd.to_datetime([getattr(form, attr) for form in filtered_forms])
+
+    return pd.DataFrame(columns, copy=False)
+
+
+@st.cache_data(ttl=300)
+def build_export(status_filter: str, export_format: str, version: int) -> bytes:
+    """Serialized export bytes, so re-applying the same filter is instant"""
+    serializer, _, _ = EXPORT_FORMATS[export_format]
+    df_export = build_export_frame(status_filter, version)
+
+    # Format dates in one vectorized pass per column
+    formatted = {
+        name: df_export[name].dt.strftime('%Y-%m-%d %H:%M').fillna('')
+        for name in EXPORT_DATE_COLUMNS
+    }
+    return serializer(df_export.assign(**formatted))
 
 
 def show_data_export(all_forms):
@@ -995,69 +1211,45 @@ def show_data_export(all_forms):
         status_filter = st.selectbox("Filtrar por estado:", [
                                      "Todos", "APROBADO", "PENDIENTE", "RECHAZADO"])
 
-    # Filter data
-    filtered_forms = all_forms
-    if status_filter != "Todos":
-        filtered_forms = [
-            f for f in all_forms if f.estado.value == status_filter]
+    # Filter data in SQL rather than in Python; one version for the whole export
+    version = get_data_version()
+    try:
+        filtered_forms = load_export_forms(status_filter, version)
+    except Exception as e:
+        st.error(f"Error al cargar formularios: {e}")
+        return
 
     st.info(f"Se exportarán {len(filtered_forms)} registros.")
 
     if st.button("🔄 Generar Exportación"):
         try:
-            # Prepare data for export
-            export_data = []
-            for form in filtered_forms:
-                export_data.append({
-                    'ID': form.id,
-                    'Nombre Completo': form.nombre_completo,
-                    'Correo Institucional': form.correo_institucional,
-                    'Estado': form.estado.value,
-                    'Fecha Envío': form.fecha_envio.strftime('%Y-%m-%d %H:%M') if form.fecha_envio else '',
-                    'Fecha Revisión': form.fecha_revision.strftime('%Y-%m-%d %H:%M') if form.fecha_revision else '',
-                    'Estado Revisión': 'Revisado' if form.revisado_por else 'Pendiente',
-                    'Cursos': len(form.cursos_capacitacion),
-                    'Publicaciones': len(form.publicaciones),
-                    'Eventos': len(form.eventos_academicos),
-                    'Diseños Curriculares': len(form.diseno_curricular),
-                    'Movilidades': len(form.movilidad),
-                    'Reconocimientos': len(form.reconocimientos),
-                    'Certificaciones': len(form.certificaciones)
-                })
-
-            df_export = pd.DataFrame(export_data)
-
-            if export_format == "CSV":
-                csv = df_export.to_csv(index=False)
-                st.download_button(
-                    label="📥 Descargar CSV",
-                    data=csv,
-                    file_name=f"reportes_docentes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv",
-                    mime="text/csv"
-                )
+            export_data = build_export(status_filter, export_format, version)
+            _, extension, mime = EXPORT_FORMATS[export_format]
 
-            elif export_format == "Excel":
-                # For Excel export, we'd need to use BytesIO
-                st.info("Funcionalidad de Excel en desarrollo. Use CSV por ahora.")
-
-            elif export_format == "JSON":
-                json_data = df_export.to_json(orient='records', indent=2)
-                st.download_button(
-                    label="📥 Descargar JSON",
-                    data=json_data,
-                    file_name=f"reportes_docentes_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                    mime="application/json"
-                )
+            # One timestamp per export for the file name
+            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+
+            st.download_button(
+                label=f"📥 Descargar {export_format}",
+                data=export_data,
+                file_name=f"reportes_docentes_{timestamp}.{extension}",
+                mime=mime
+            )
 
             st.success("✅ Exportación generada exitosamente!")
 
             # Show preview
             st.subheader("👀 Vista Previa")
-            st.dataframe(df_export.head(10), width="stretch")
+            df_export = build_export_frame(status_filter, version)
+            # Arrow carries the raw timestamps; the frontend formats them
+            st.dataframe(arrow_preview(df_export, max_rows=10), width="stretch",
+                         column_config={
+                             name: st.column_config.DatetimeColumn(name, format="YYYY-MM-DD HH:mm")
+                             for name in EXPORT_DATE_COLUMNS
+                         })
 
         except Exception as e:
             st.error(f"Error al generar exportación: {e}")
 
-
 if __name__ == "__main__":
     main()
@@ -2,47 +2,45 @@
 Cargador de variables de entorno desde archivo .env
 """
 import os
+import re
 from pathlib import Path
 
+# KEY=VALUE por línea; el valor puede ir entre comillas dobles o simples.
+# Las líneas vacías, los comentarios (#) y las líneas sin '=' no coinciden.
+ENV_LINE_PATTERN = re.compile(
+    r'''^[ \t]*([^#\s=][^=\n]*?)[ \t]*=[ \t]*(?:"(.*)"|'(.*)'|(.*?))[ \t]*\r?$''',
+    re.MULTILINE
+)
+
+# mtime del .env ya cargado, para que llamadas repetidas cuesten un solo stat
+_loaded_mtime = None
+
 def load_env_file():
     """Carga variables de entorno desde archivo .env si existe"""
+    global _loaded_mtime
     env_file = Path(__file__).parent / '.env'
-    
-    if not env_file.exists():
+
+    try:
+        mtime = env_file.stat().st_mtime
+    except OSError:
+        return
+
+    if mtime == _loaded_mtime:
         return
-    
+
     try:
-        with open(env_file, 'r', encoding='utf-8') as f:
-            for line_num, line in enumerate(f, 1):
-                line = line.strip()
-                
-                # Saltar líneas vacías y comentarios
-                if not line or line.startswith('#'):
-                    continue
-                
-                # Procesar líneas con formato KEY=VALUE
-                if '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remover comillas si existen
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    
-                    # Establecer variable de entorno
-                    os.environ[key] = value
-                # Líneas con formato inválido se ignoran silenciosamente
-                pass
-        
-        # Variables cargadas silenciosamente
-        pass
-            
+        text = env_file.read_text(encoding='utf-8')
+
+        # Un solo barrido del archivo y una sola actualización del entorno
+        os.environ.update({
+            key: double_quoted or single_quoted or plain
+            for key, double_quoted, single_quoted, plain in ENV_LINE_PATTERN.findall(text)
+        })
+        _loaded_mtime = mtime
+
     except Exception as e:
         # Errores se ignoran silenciosamente
         pass
 
 if __name__ == "__main__":
-    load_env_file()
\ No newline at end of file
+    load_env_file()
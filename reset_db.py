@@ -31,16 +31,17 @@ def borrar_datos():
             print("✅ Ya está limpio")
             return
 
-        # Borrar todo (en orden para respetar las foreign keys)
-        db.query(OtraActividadAcademicaDB).delete()
-        db.query(CertificacionDB).delete()
-        db.query(ReconocimientoDB).delete()
-        db.query(ExperienciaMovilidadDB).delete()
-        db.query(DisenoCurricularDB).delete()
-        db.query(EventoAcademicoDB).delete()
-        db.query(PublicacionDB).delete()
-        db.query(CursoCapacitacionDB).delete()
-        db.query(FormularioEnvioDB).delete()
+        # Borrar todo (en orden para respetar las foreign keys). La sesión está
+        # vacía, así que no hace falta sincronizar el identity map tras cada DELETE
+        db.query(OtraActividadAcademicaDB).delete(synchronize_session=False)
+        db.query(CertificacionDB).delete(synchronize_session=False)
+        db.query(ReconocimientoDB).delete(synchronize_session=False)
+        db.query(ExperienciaMovilidadDB).delete(synchronize_session=False)
+        db.query(DisenoCurricularDB).delete(synchronize_session=False)
+        db.query(EventoAcademicoDB).delete(synchronize_session=False)
+        db.query(PublicacionDB).delete(synchronize_session=False)
+        db.query(CursoCapacitacionDB).delete(synchronize_session=False)
+        db.query(FormularioEnvioDB).delete(synchronize_session=False)
 
         db.commit()
 
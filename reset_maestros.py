@@ -27,8 +27,8 @@ def borrar_maestros():
             print("✅ Ya está limpio")
             return
 
-        # Borrar todos los maestros autorizados
-        db.query(MaestroAutorizadoDB).delete()
+        # Borrar todos los maestros autorizados (DELETE directo, sin sincronizar la sesión)
+        db.query(MaestroAutorizadoDB).delete(synchronize_session=False)
         db.commit()
 
         print(f"✅ {total} maestros eliminados")
@@ -24,36 +24,83 @@ from app.models.database import (
     MaestroAutorizadoDB, NotificacionEmailDB, AuditLogDB
 )
 from app.models.audit import AuditLog
+from app.models.form_history import FormularioHistoryDB
 from app.database.connection import SessionLocal
+from sqlalchemy import text, select, func, inspect
+
+# Todas las tablas que se vacían, en el orden de borrado de las funciones de abajo
+MODELOS_A_BORRAR = [
+    NotificacionEmailDB, AuditLog, AuditLogDB, FormularioHistoryDB,
+    OtraActividadAcademicaDB, CertificacionDB, ReconocimientoDB,
+    ExperienciaMovilidadDB, DisenoCurricularDB, EventoAcademicoDB,
+    PublicacionDB, CursoCapacitacionDB, FormularioEnvioDB,
+    MaestroAutorizadoDB
+]
+
+
+# Salida con búfer: los mensajes de cada etapa se escriben juntos al hacer flush
+try:
+    sys.stdout.reconfigure(line_buffering=False, write_through=False)
+except AttributeError:
+    pass
+
+ADVERTENCIA = """{sep}
+⚠️  ADVERTENCIA: BORRADO DE DATOS DE PRODUCCIÓN
+{sep}
+
+Estás a punto de borrar datos de la base de datos en Render:
+🗄️  Base de datos: PostgreSQL en Render
+
+¿Qué se borrará?
+  1. Todos los formularios enviados
+  2. Todo el historial de versiones de formularios
+  3. Todas las actividades académicas
+  4. Todos los maestros autorizados
+  5. Todas las notificaciones de email
+  6. Todos los logs de auditoría
+
+⚠️  ESTA ACCIÓN NO SE PUEDE DESHACER
+{sep}""".format(sep="=" * 60)
 
 
 def confirmar_accion():
     """Pedir confirmación antes de borrar"""
-    print("=" * 60)
-    print("⚠️  ADVERTENCIA: BORRADO DE DATOS DE PRODUCCIÓN")
-    print("=" * 60)
-    print("\nEstás a punto de borrar datos de la base de datos en Render:")
-    print(f"🗄️  Base de datos: PostgreSQL en Render")
-    print("\n¿Qué se borrará?")
-    print("  1. Todos los formularios enviados")
-    print("  2. Todas las actividades académicas")
-    print("  3. Todos los maestros autorizados")
-    print("  4. Todas las notificaciones de email")
-    print("  5. Todos los logs de auditoría")
-    print("\n⚠️  ESTA ACCIÓN NO SE PUEDE DESHACER")
-    print("=" * 60)
+    print(ADVERTENCIA)
     
     respuesta = input("\n¿Estás seguro? Escribe 'SI BORRAR TODO' para confirmar: ")
     return respuesta == "SI BORRAR TODO"
 
 
+def contar_tablas(db, *modelos):
+    """Cuenta las filas de varias tablas en una sola consulta"""
+    return db.execute(select(*[
+        select(func.count()).select_from(modelo).scalar_subquery()
+        for modelo in modelos
+    ])).one()
+
+
+def borrar_tablas(db, modelos):
+    """Borra todas las filas de varias tablas, en el orden dado
+
+    Solo se usa fuera de PostgreSQL; allí main() vacía todo con truncar_todo.
+    """
+    # DELETE de Core por tabla, sin pasar por el ORM
+    for modelo in modelos:
+        db.execute(modelo.__table__.delete())
+
+
+def modelos_existentes(db, modelos):
+    """Filtra los modelos cuya tabla existe (p. ej. formularios_historial es opcional)"""
+    inspector = inspect(db.get_bind())
+    return [modelo for modelo in modelos if inspector.has_table(modelo.__tablename__)]
+
+
 def borrar_audit_logs(db):
     """Borra todos los logs de auditoría"""
     print("\n🗑️  Borrando logs de auditoría...")
     
     # Borrar de ambas tablas de auditoría
-    total1 = db.query(AuditLog).count()
-    total2 = db.query(AuditLogDB).count()
+    total1, total2 = contar_tablas(db, AuditLog, AuditLogDB)
     total = total1 + total2
     
     print(f"📊 Encontrados: {total} logs de auditoría (audit_logs: {total1}, audit_log: {total2})")
@@ -63,8 +110,7 @@ def borrar_audit_logs(db):
         return
     
     # Borrar ambas tablas
-    db.query(AuditLog).delete()
-    db.query(AuditLogDB).delete()
+    borrar_tablas(db, [AuditLog, AuditLogDB])
     db.commit()
     print(f"✅ {total} logs eliminados")
 
@@ -73,11 +119,9 @@ def borrar_formularios(db):
     """Borra todos los formularios y actividades relacionadas"""
     print("\n🗑️  Borrando formularios y actividades...")
     
-    # Contar antes
-    total_formularios = db.query(FormularioEnvioDB).count()
-    total_cursos = db.query(CursoCapacitacionDB).count()
-    total_publicaciones = db.query(PublicacionDB).count()
-    total_eventos = db.query(EventoAcademicoDB).count()
+    # Contar antes (un solo roundtrip con subconsultas escalares)
+    total_formularios, total_cursos, total_publicaciones, total_eventos = contar_tablas(
+        db, FormularioEnvioDB, CursoCapacitacionDB, PublicacionDB, EventoAcademicoDB)
     
     print(f"📊 Encontrados:")
     print(f"   - {total_formularios} formularios")
@@ -90,15 +134,11 @@ def borrar_formularios(db):
         return
     
     # Borrar en orden (respetando foreign keys)
-    db.query(OtraActividadAcademicaDB).delete()
-    db.query(CertificacionDB).delete()
-    db.query(ReconocimientoDB).delete()
-    db.query(ExperienciaMovilidadDB).delete()
-    db.query(DisenoCurricularDB).delete()
-    db.query(EventoAcademicoDB).delete()
-    db.query(PublicacionDB).delete()
-    db.query(CursoCapacitacionDB).delete()
-    db.query(FormularioEnvioDB).delete()
+    borrar_tablas(db, modelos_existentes(db, [
+        FormularioHistoryDB, OtraActividadAcademicaDB, CertificacionDB, ReconocimientoDB,
+        ExperienciaMovilidadDB, DisenoCurricularDB, EventoAcademicoDB,
+        PublicacionDB, CursoCapacitacionDB, FormularioEnvioDB
+    ]))
     
     db.commit()
     print(f"✅ {total_formularios} formularios eliminados")
@@ -115,7 +155,7 @@ def borrar_maestros(db):
         print("✅ No hay maestros para borrar")
         return
     
-    db.query(MaestroAutorizadoDB).delete()
+    db.query(MaestroAutorizadoDB).delete(synchronize_session=False)
     db.commit()
     print(f"✅ {total} maestros eliminados")
 
@@ -131,11 +171,26 @@ def borrar_notificaciones(db):
         print("✅ No hay notificaciones para borrar")
         return
     
-    db.query(NotificacionEmailDB).delete()
+    db.query(NotificacionEmailDB).delete(synchronize_session=False)
     db.commit()
     print(f"✅ {total} notificaciones eliminadas")
 
 
+def truncar_todo(db):
+    """Vacía todas las tablas con un solo TRUNCATE (solo PostgreSQL)"""
+    print("\n🗑️  Vaciando todas las tablas con TRUNCATE...")
+    
+    modelos = modelos_existentes(db, MODELOS_A_BORRAR)
+    tablas = ", ".join(modelo.__tablename__ for modelo in modelos)
+    
+    # Un solo roundtrip: sin escaneo por fila ni tuplas muertas en el WAL.
+    # Sin CASCADE: si otra tabla no listada apunta a estas, TRUNCATE falla
+    # en lugar de vaciarla sin avisar
+    db.execute(text(f"TRUNCATE TABLE {tablas} RESTART IDENTITY"))
+    db.commit()
+    print(f"✅ {len(modelos)} tablas vaciadas: {tablas}")
+
+
 def main():
     """Función principal"""
     
@@ -148,23 +203,24 @@ def main():
     
     db = SessionLocal()
     try:
-        # Borrar notificaciones primero (tienen foreign key a maestros)
-        borrar_notificaciones(db)
-        
-        # Borrar logs de auditoría (tienen foreign key a formularios)
-        borrar_audit_logs(db)
-        
-        # Borrar formularios y actividades
-        borrar_formularios(db)
+        if db.get_bind().dialect.name == "postgresql":
+            # PostgreSQL: una sola sentencia en una sola transacción
+            etapas = [truncar_todo]
+        else:
+            etapas = [
+                borrar_notificaciones,  # Primero (tienen foreign key a maestros)
+                borrar_audit_logs,      # Tienen foreign key a formularios
+                borrar_formularios,     # Formularios y actividades
+                borrar_maestros
+            ]
         
-        # Borrar maestros
-        borrar_maestros(db)
+        for etapa in etapas:
+            etapa(db)
+            sys.stdout.flush()  # Un solo write por etapa
         
-        print("\n" + "=" * 60)
-        print("✅ PROCESO COMPLETADO")
-        print("=" * 60)
-        print("🎯 Base de datos de producción limpia")
-        print("💾 Los datos han sido eliminados permanentemente")
+        print("\n{sep}\n✅ PROCESO COMPLETADO\n{sep}\n"
+              "🎯 Base de datos de producción limpia\n"
+              "💾 Los datos han sido eliminados permanentemente".format(sep="=" * 60))
         
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -173,6 +229,7 @@ def main():
         
     finally:
         db.close()
+        sys.stdout.flush()
         # Restaurar la URL original
         if original_db_url:
             os.environ['DATABASE_URL'] = original_db_url
@@ -4,11 +4,16 @@ Sistema de Reportes Docentes - Launcher Optimizado
 Punto de entrada único para el sistema completo
 """
 
+import hashlib
+import importlib.util
 import os
 import sys
-import subprocess
 from pathlib import Path
 
+# Con --dev Streamlit vigila los archivos y recarga al guardar; en producción
+# el watcher solo consume CPU revisando el proyecto y site-packages
+FILE_WATCHER_TYPE = "auto" if "--dev" in sys.argv else "none"
+
 def setup_environment():
     """Configurar variables de entorno para rendimiento óptimo"""
     # Cargar archivo .env si existe
@@ -27,17 +32,52 @@ def setup_environment():
         'STREAMLIT_LOGGER_LEVEL': 'WARNING',
         'STREAMLIT_CLIENT_TOOLBAR_MODE': 'minimal',
         'STREAMLIT_SERVER_MAX_UPLOAD_SIZE': '200',
-        'STREAMLIT_SERVER_MAX_MESSAGE_SIZE': '200'
+        'STREAMLIT_SERVER_MAX_MESSAGE_SIZE': '200',
+        'STREAMLIT_SERVER_FILE_WATCHER_TYPE': FILE_WATCHER_TYPE
     })
 
+REQUIRED_PACKAGES = ("streamlit", "pandas", "plotly", "sqlalchemy")
+
+# Marcadores de verificación de dependencias ya superada
+DEPS_CACHE_DIR = Path.home() / ".cache" / "reportes_docentes"
+
+def _deps_marker():
+    """Marcador ligado al intérprete/venv, al checkout y al mtime de requirements.txt"""
+    project_dir = Path(__file__).resolve().parent
+    requirements = project_dir / "requirements.txt"
+    try:
+        mtime = requirements.stat().st_mtime
+    except OSError:
+        return None
+    # ~/.cache es compartido por todos los venv: sys.prefix y sys.executable
+    # distinguen cada entorno y project_dir cada checkout
+    key = hashlib.sha1(
+        f"{sys.version}{sys.prefix}{sys.executable}{project_dir}{mtime}".encode()
+    ).hexdigest()
+    return DEPS_CACHE_DIR / f"deps_ok_{key}"
+
 def check_dependencies():
     """Verificar dependencias críticas"""
-    try:
-        import streamlit, pandas, plotly, sqlalchemy
+    marker = _deps_marker()
+    if marker is not None and marker.exists():
         return True
-    except ImportError:
-        print("❌ Faltan dependencias. Ejecuta: pip install -r requirements.txt")
+    
+    # find_spec solo localiza el paquete, sin ejecutar su __init__
+    missing = [
+        package for package in REQUIRED_PACKAGES
+        if importlib.util.find_spec(package) is None
+    ]
+    if missing:
+        print(f"❌ Faltan dependencias ({', '.join(missing)}). Ejecuta: pip install -r requirements.txt")
         return False
+    
+    if marker is not None:
+        try:
+            marker.parent.mkdir(parents=True, exist_ok=True)
+            marker.touch()
+        except OSError:
+            pass
+    return True
 
 def initialize_system():
     """Inicializar sistema de forma silenciosa"""
@@ -53,20 +93,31 @@ def initialize_system():
 
 def start_system():
     """Iniciar el sistema de forma optimizada"""
-    print("🚀 Iniciando Sistema de Reportes Docentes...")
-    print("🔗 Acceso: http://localhost:8501")
+    sys.stdout.write(
+        "🚀 Iniciando Sistema de Reportes Docentes...\n"
+        "🔗 Acceso: http://localhost:8501\n"
+    )
+    sys.stdout.flush()
     
     app_path = Path(__file__).parent / "dashboard" / "streamlit_app.py"
     
+    # Mismas opciones que los flags de "streamlit run", en formato seccion_opcion
+    flag_options = {
+        "server_enableCORS": False,
+        "server_enableXsrfProtection": False,
+        "browser_gatherUsageStats": False,
+        "server_maxUploadSize": 200,
+        "logger_level": "warning",
+        "server_fileWatcherType": FILE_WATCHER_TYPE,
+    }
+    
     try:
-        subprocess.run([
-            sys.executable, "-m", "streamlit", "run", str(app_path),
-            "--server.enableCORS", "false",
-            "--server.enableXsrfProtection", "false",
-            "--browser.gatherUsageStats", "false",
-            "--server.maxUploadSize", "200",
-            "--logger.level", "warning"
-        ], check=True, env=os.environ.copy())
+        # Arrancar Streamlit en este mismo proceso: reutiliza los módulos ya
+        # importados por initialize_system en lugar de lanzar otro intérprete
+        from streamlit.web import bootstrap
+        
+        bootstrap.load_config_options(flag_options=flag_options)
+        bootstrap.run(str(app_path), False, [], flag_options)
         
     except KeyboardInterrupt:
         print("\n🛑 Sistema detenido")
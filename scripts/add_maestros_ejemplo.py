@@ -3,8 +3,6 @@
 Script para agregar maestros de ejemplo al sistema
 """
 
-from app.models.database import MaestroAutorizadoDB
-from app.database.connection import SessionLocal
 import os
 import sys
 from datetime import datetime
@@ -41,34 +39,43 @@ def agregar_maestros_ejemplo():
     
     print("👥 Agregando maestros de ejemplo...")
     
+    # Importar el ORM solo cuando realmente se va a usar
+    from app.models.database import MaestroAutorizadoDB
+    from app.database.connection import SessionLocal
+    
     db = SessionLocal()
     try:
-        agregados = 0
+        # Verificar cuáles ya existen con una sola consulta IN
+        correos = [m["correo_institucional"] for m in maestros_ejemplo]
+        existentes = {
+            correo for (correo,) in db.query(MaestroAutorizadoDB.correo_institucional).filter(
+                MaestroAutorizadoDB.correo_institucional.in_(correos)
+            )
+        }
         
+        # Misma marca de tiempo para todo el lote
+        ahora = datetime.utcnow()
+        nuevos_maestros = []
         for maestro_data in maestros_ejemplo:
-            # Verificar si ya existe
-            existe = db.query(MaestroAutorizadoDB).filter(
-                MaestroAutorizadoDB.correo_institucional == maestro_data["correo_institucional"]
-            ).first()
-            
-            if existe:
+            if maestro_data["correo_institucional"] in existentes:
                 print(f"⚠️  Ya existe: {maestro_data['nombre_completo']}")
                 continue
             
-            # Crear nuevo maestro
-            nuevo_maestro = MaestroAutorizadoDB(
-                nombre_completo=maestro_data["nombre_completo"],
-                correo_institucional=maestro_data["correo_institucional"],
-                activo=True,
-                fecha_creacion=datetime.utcnow(),
-                fecha_actualizacion=datetime.utcnow()
-            )
-            
-            db.add(nuevo_maestro)
-            agregados += 1
+            # Fila para el INSERT masivo
+            nuevos_maestros.append({
+                "nombre_completo": maestro_data["nombre_completo"],
+                "correo_institucional": maestro_data["correo_institucional"],
+                "activo": True,
+                "fecha_creacion": ahora,
+                "fecha_actualizacion": ahora
+            })
             print(f"✅ Agregado: {maestro_data['nombre_completo']}")
         
-        db.commit()
+        # Un solo INSERT con executemany vía Core, sin pasar por el ORM
+        if nuevos_maestros:
+            db.execute(MaestroAutorizadoDB.__table__.insert(), nuevos_maestros)
+            db.commit()
+        agregados = len(nuevos_maestros)
         
         print(f"\n🎯 {agregados} maestros de ejemplo agregados exitosamente")
         
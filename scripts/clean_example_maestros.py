@@ -20,30 +20,20 @@ def clean_example_maestros():
     crud = MaestroAutorizadoCRUD(db)
     
     try:
-        # Obtener todos los maestros
-        maestros = crud.get_all_maestros()
+        # Listado detallado solo con --verbose; por defecto basta un UPDATE
+        if "--verbose" in sys.argv:
+            maestros = crud.get_all_maestros()
+            print(f"📋 Encontrados {len(maestros)} maestros:")
+            for maestro in maestros:
+                print(f"  - {maestro.nombre_completo} ({maestro.correo_institucional})")
         
-        if not maestros:
+        # Eliminar (desactivar) todos los maestros en una sola sentencia
+        deleted_count = crud.delete_all_maestros()
+        
+        if not deleted_count:
             print("ℹ️ No hay maestros en la base de datos.")
             return
         
-        print(f"📋 Encontrados {len(maestros)} maestros:")
-        for maestro in maestros:
-            print(f"  - {maestro.nombre_completo} ({maestro.correo_institucional})")
-        
-        # Confirmar eliminación
-        print("\n⚠️ ¿Está seguro de que desea eliminar TODOS los maestros?")
-        print("Esto eliminará todos los maestros de la base de datos.")
-        
-        # Eliminar todos los maestros
-        deleted_count = 0
-        for maestro in maestros:
-            if crud.delete_maestro(maestro.id):
-                print(f"  ✅ Eliminado: {maestro.nombre_completo}")
-                deleted_count += 1
-            else:
-                print(f"  ❌ Error eliminando: {maestro.nombre_completo}")
-        
         print(f"\n🎉 Se eliminaron {deleted_count} maestros exitosamente.")
         print("📝 Ahora puede agregar los maestros reales desde la página 'Maestros Autorizados'.")
         
@@ -3,11 +3,96 @@
 Script para limpiar archivos temporales y optimizar el sistema
 """
 
+import io
 import os
 import shutil
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Borrar archivos es I/O puro: varios hilos solapan las llamadas al sistema
+MAX_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+
+# Sufijos de archivos temporales (equivalen a *.tmp, *.temp, *.bak, *.swp, *~)
+TEMP_SUFFIXES = (".tmp", ".temp", ".bak", ".swp", "~")
+
+# Directorios que nunca contienen basura del proyecto; no se recorren
+SKIP_DIRS = {"venv", ".venv", ".git", "node_modules", ".mypy_cache", ".pytest_cache"}
+
+_scan_cache = {}
+_scan_lock = threading.Lock()
+
+
+def scan_tree(root_dir):
+    """Un solo recorrido del árbol: directorios __pycache__ y archivos temporales"""
+    key = str(root_dir)
+    with _scan_lock:  # cleanup_pycache y cleanup_temp_files corren a la vez
+        if key not in _scan_cache:
+            _scan_cache[key] = _walk_tree(root_dir)
+    return _scan_cache[key]
+
+
+def _walk_tree(root_dir):
+    """Recorrido real de scan_tree"""
+    pycache_dirs = []
+    temp_files = []
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        if "__pycache__" in dirnames:
+            pycache_dirs.append(Path(dirpath) / "__pycache__")
+            dirnames.remove("__pycache__")  # Se borra entero, no hace falta entrar
+        temp_files.extend(Path(dirpath) / name for name in filenames
+                          if name.endswith(TEMP_SUFFIXES))
+    return pycache_dirs, temp_files
+
+
+class _PhaseOutput(io.TextIOBase):
+    """stdout que desvía lo impreso por cada hilo de fase a su propio buffer"""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer or self._stream).write(text)
+
+    def flush(self):
+        self._stream.flush()
+
+    def run(self, phase):
+        """Ejecutar una fase capturando su salida; devuelve el texto impreso"""
+        self._local.buffer = io.StringIO()
+        try:
+            phase()
+            return self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
+def run_phases(output, *phases):
+    """Ejecutar fases independientes en paralelo e imprimir su salida en orden"""
+    with ThreadPoolExecutor(max_workers=len(phases)) as executor:
+        futures = [executor.submit(output.run, phase) for phase in phases]
+        for future in futures:
+            sys.stdout.write(future.result())
+            print()
+
+
+def remove_all(paths, remove):
+    """Aplicar `remove` a todas las rutas en paralelo; devuelve los errores"""
+    def try_remove(path):
+        try:
+            remove(path)
+            return path, None
+        except Exception as e:
+            return path, e
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(try_remove, paths))
+
 
 def cleanup_pycache():
     """Eliminar archivos __pycache__"""
@@ -16,13 +101,14 @@ def cleanup_pycache():
     root_dir = Path(__file__).parent.parent
     deleted_count = 0
 
-    for pycache_dir in root_dir.rglob("__pycache__"):
-        try:
-            shutil.rmtree(pycache_dir)
+    # Recolectar primero, borrar en paralelo e informar en orden al final
+    pycache_dirs, _ = scan_tree(root_dir)
+    for pycache_dir, error in remove_all(pycache_dirs, shutil.rmtree):
+        if error is None:
             deleted_count += 1
             print(f"   ✅ Eliminado: {pycache_dir}")
-        except Exception as e:
-            print(f"   ❌ Error eliminando {pycache_dir}: {e}")
+        else:
+            print(f"   ❌ Error eliminando {pycache_dir}: {error}")
 
     print(f"📊 {deleted_count} directorios __pycache__ eliminados")
 
@@ -36,8 +122,12 @@ def cleanup_logs():
         print("   ℹ️ No hay directorio de logs")
         return
 
-    log_files = sorted(logs_dir.glob("*.log"),
-                       key=os.path.getmtime, reverse=True)
+    # DirEntry guarda su stat: un solo stat por archivo al ordenar
+    with os.scandir(logs_dir) as entries:
+        log_files = sorted(
+            (entry for entry in entries
+             if entry.name.endswith(".log") and entry.is_file()),
+            key=lambda entry: entry.stat().st_mtime, reverse=True)
 
     if len(log_files) <= 5:
         print(
@@ -46,10 +136,10 @@ def cleanup_logs():
 
     for log_file in log_files[5:]:  # Mantener solo los 5 más recientes
         try:
-            log_file.unlink()
+            os.unlink(log_file.path)
             print(f"   ✅ Eliminado: {log_file.name}")
         except Exception as e:
-            print(f"   ❌ Error eliminando {log_file}: {e}")
+            print(f"   ❌ Error eliminando {log_file.path}: {e}")
 
 
 def cleanup_temp_files():
@@ -57,17 +147,17 @@ def cleanup_temp_files():
     print("🗂️ Limpiando archivos temporales...")
 
     root_dir = Path(__file__).parent.parent
-    temp_patterns = ["*.tmp", "*.temp", "*.bak", "*.swp", "*~"]
     deleted_count = 0
 
-    for pattern in temp_patterns:
-        for temp_file in root_dir.rglob(pattern):
-            try:
-                temp_file.unlink()
-                deleted_count += 1
-                print(f"   ✅ Eliminado: {temp_file}")
-            except Exception as e:
-                print(f"   ❌ Error eliminando {temp_file}: {e}")
+    # Reutiliza el recorrido hecho por cleanup_pycache (un solo paso por el árbol)
+    _, temp_files = scan_tree(root_dir)
+
+    for temp_file, error in remove_all(temp_files, Path.unlink):
+        if error is None:
+            deleted_count += 1
+            print(f"   ✅ Eliminado: {temp_file}")
+        else:
+            print(f"   ❌ Error eliminando {temp_file}: {error}")
 
     print(f"📊 {deleted_count} archivos temporales eliminados")
 
@@ -83,21 +173,40 @@ def cleanup_empty_dirs():
     protected_dirs = {"logs", "data", "reports",
                       "uploads", "backups", ".git", ".kiro"}
 
-    for dir_path in root_dir.rglob("*"):
-        if dir_path.is_dir() and dir_path.name not in protected_dirs:
-            try:
-                if not any(dir_path.iterdir()):  # Directorio vacío
-                    dir_path.rmdir()
-                    deleted_count += 1
-                    print(f"   ✅ Eliminado: {dir_path}")
-            except Exception:
-                pass  # Ignorar errores silenciosamente
+    # Recorrido descendente para podar SKIP_DIRS, procesado luego de abajo hacia
+    # arriba: el contenido de cada directorio ya viene en filenames/dirnames, sin
+    # un iterdir extra por candidato. Los hijos que se acaban de borrar no
+    # cuentan, así también caen los padres que quedan vacíos.
+    walked = []
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+        walked.append((dirpath, dirnames, filenames))
+
+    removed = set()
+    for dirpath, dirnames, filenames in reversed(walked):
+        if filenames or dirpath == str(root_dir):
+            continue
+        if os.path.basename(dirpath) in protected_dirs:
+            continue
+        if any(os.path.join(dirpath, d) not in removed for d in dirnames):
+            continue
+        try:
+            os.rmdir(dirpath)
+            removed.add(dirpath)
+            deleted_count += 1
+            print(f"   ✅ Eliminado: {dirpath}")
+        except OSError:
+            pass  # Ignorar errores silenciosamente
 
     print(f"📊 {deleted_count} directorios vacíos eliminados")
 
 
-def optimize_database():
-    """Optimizar base de datos SQLite"""
+def optimize_database(full=False):
+    """Optimizar base de datos SQLite
+
+    Por defecto solo libera páginas vacías (incremental_vacuum) y deja que
+    PRAGMA optimize analice lo necesario; VACUUM completo solo con --full.
+    """
     print("🗄️ Optimizando base de datos...")
 
     db_path = Path(__file__).parent.parent / "reportes_docentes.db"
@@ -110,11 +219,24 @@ def optimize_database():
         import sqlite3
 
         with sqlite3.connect(str(db_path)) as conn:
-            # VACUUM para optimizar y compactar
-            conn.execute("VACUUM")
+            conn.execute("PRAGMA journal_mode=WAL")
+
+            # auto_vacuum=INCREMENTAL (2) se configura una vez; en una base
+            # existente se aplica tras el siguiente VACUUM completo
+            needs_rebuild = conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2
+            if needs_rebuild:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
 
-            # ANALYZE para actualizar estadísticas
-            conn.execute("ANALYZE")
+            if full:
+                # Reescribe todo el archivo y bloquea la base; solo bajo demanda
+                conn.execute("VACUUM")
+            else:
+                conn.execute("PRAGMA incremental_vacuum")
+                if needs_rebuild:
+                    print("   ℹ️ Ejecuta con --full una vez para activar el vacuum incremental")
+
+            # ANALYZE dirigido solo a las tablas que lo necesitan
+            conn.execute("PRAGMA optimize")
 
             print("   ✅ Base de datos optimizada")
 
@@ -128,15 +250,35 @@ def show_disk_usage():
 
     root_dir = Path(__file__).parent.parent
 
-    def get_dir_size(path):
-        total = 0
-        try:
-            for entry in path.rglob("*"):
-                if entry.is_file():
-                    total += entry.stat().st_size
-        except Exception:
-            pass
-        return total
+    def walk_sizes(root, keep=()):
+        """Tamaño por directorio de primer nivel, con un solo recorrido scandir
+
+        Omite SKIP_DIRS salvo los de primer nivel incluidos en `keep`.
+        """
+        sizes = {}
+
+        def add_tree(path, top):
+            try:
+                with os.scandir(path) as entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            if entry.name not in SKIP_DIRS:
+                                add_tree(entry.path, top)
+                        elif entry.is_file(follow_symlinks=False):
+                            # DirEntry.stat reutiliza datos de scandir cuando puede
+                            sizes[top] = sizes.get(top, 0) + \
+                                entry.stat(follow_symlinks=False).st_size
+            except OSError:
+                pass
+
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS or entry.name in keep:
+                        add_tree(entry.path, entry.name)
+                elif entry.is_file(follow_symlinks=False):
+                    sizes[""] = sizes.get("", 0) + entry.stat(follow_symlinks=False).st_size
+        return sizes
 
     def format_size(bytes_size):
         for unit in ['B', 'KB', 'MB', 'GB']:
@@ -149,14 +291,14 @@ def show_disk_usage():
     directories = ["app", "dashboard", "data",
                    "logs", "reports", "uploads", "venv"]
 
+    sizes = walk_sizes(root_dir, keep=directories)
+
     for dir_name in directories:
-        dir_path = root_dir / dir_name
-        if dir_path.exists():
-            size = get_dir_size(dir_path)
-            print(f"   📁 {dir_name}: {format_size(size)}")
+        if dir_name in sizes or (root_dir / dir_name).is_dir():
+            print(f"   📁 {dir_name}: {format_size(sizes.get(dir_name, 0))}")
 
-    # Tamaño total
-    total_size = get_dir_size(root_dir)
+    # Tamaño total (del mismo recorrido, sin volver a leer el árbol)
+    total_size = sum(sizes.values())
     print(f"   📊 Total: {format_size(total_size)}")
 
 
@@ -165,24 +307,19 @@ def main():
     print("🧹 LIMPIEZA Y OPTIMIZACIÓN DEL SISTEMA")
     print("=" * 50)
 
+    output = _PhaseOutput(sys.stdout)
+    sys.stdout = output
     try:
-        cleanup_pycache()
-        print()
-
-        cleanup_logs()
-        print()
-
-        cleanup_temp_files()
-        print()
+        # Fases independientes (partes distintas del árbol) en paralelo
+        run_phases(output, cleanup_pycache, cleanup_logs, cleanup_temp_files)
 
+        # Necesita que las anteriores hayan vaciado sus directorios
         cleanup_empty_dirs()
         print()
 
-        optimize_database()
-        print()
-
-        show_disk_usage()
-        print()
+        run_phases(output,
+                   lambda: optimize_database(full="--full" in sys.argv),
+                   show_disk_usage)
 
         print("✅ Limpieza completada exitosamente!")
         print("🚀 El sistema debería funcionar más rápido ahora")
@@ -190,6 +327,8 @@ def main():
     except Exception as e:
         print(f"❌ Error durante la limpieza: {e}")
         return False
+    finally:
+        sys.stdout = output._stream
 
     return True
 
@@ -22,30 +22,23 @@ from app.models.database import (
 # Initialize Faker for Spanish locale
 fake = Faker('es_ES')
 
+# Pools sampled with random.choice instead of one Faker provider call per value.
+# Date pools hold every ISO date in the last 1/2/3 years (same range as
+# fake.date_between(start_date='-Ny', end_date='today')).
+_NAME_POOL = [fake.name() for _ in range(128)]
+_TODAY = date.today()
+_DATE_POOL_1Y, _DATE_POOL_2Y, _DATE_POOL_3Y = (
+    [(_TODAY - timedelta(days=offset)).isoformat() for offset in range(365 * years + 1)]
+    for years in (1, 2, 3)
+)
+
 def create_authorized_teachers(db, teachers):
     """Create authorized teachers whitelist"""
     try:
-        # Check if teachers already exist
-        existing_teachers = db.query(MaestroAutorizadoDB).all()
-        existing_emails = {teacher.correo_institucional for teacher in existing_teachers}
-        
-        teachers_created = 0
-        
-        for nombre, email in teachers:
-            if email not in existing_emails:
-                # Create new authorized teacher
-                maestro = MaestroAutorizadoDB(
-                    nombre_completo=nombre,
-                    correo_institucional=email,
-                    activo=True,
-                    fecha_creacion=datetime.utcnow(),
-                    fecha_actualizacion=datetime.utcnow()
-                )
-                db.add(maestro)
-                teachers_created += 1
-                print(f"   ✅ Maestro autorizado: {nombre}")
-            else:
-                print(f"   ⚠️  Ya existe: {nombre}")
+        # Check if teachers already exist (emails only, no full ORM objects)
+        existing_emails = {
+            email for (email,) in db.query(MaestroAutorizadoDB.correo_institucional)
+        }
         
         # Add some additional teachers that haven't submitted forms yet
         additional_teachers = [
@@ -56,19 +49,32 @@ def create_authorized_teachers(db, teachers):
             ("Prof. Daniel Alejandro Cruz", "daniel.cruz@universidad.edu"),
         ]
         
+        for nombre, email in teachers:
+            if email not in existing_emails:
+                print(f"   ✅ Maestro autorizado: {nombre}")
+            else:
+                print(f"   ⚠️  Ya existe: {nombre}")
+        
         for nombre, email in additional_teachers:
             if email not in existing_emails:
-                maestro = MaestroAutorizadoDB(
-                    nombre_completo=nombre,
-                    correo_institucional=email,
-                    activo=True,
-                    fecha_creacion=datetime.utcnow(),
-                    fecha_actualizacion=datetime.utcnow()
-                )
-                db.add(maestro)
-                teachers_created += 1
                 print(f"   ✅ Maestro autorizado (sin formularios): {nombre}")
         
+        # One timestamp and one bulk insert for every new teacher
+        now = datetime.utcnow()
+        rows = [
+            {
+                "nombre_completo": nombre,
+                "correo_institucional": email,
+                "activo": True,
+                "fecha_creacion": now,
+                "fecha_actualizacion": now
+            }
+            for nombre, email in teachers + additional_teachers
+            if email not in existing_emails
+        ]
+        db.bulk_insert_mappings(MaestroAutorizadoDB, rows)
+        teachers_created = len(rows)
+        
         db.commit()
         print(f"📋 Lista blanca creada: {teachers_created} maestros autorizados")
         
@@ -110,50 +116,57 @@ def generate_test_data():
         years = [2023, 2024, 2025]
         quarters = ["Trimestre 1", "Trimestre 2", "Trimestre 3", "Trimestre 4"]
         
-        total_forms = 0
+        # Collect every form first and insert them all in one transaction
+        batch = []
+        
+        # Draw the per-form choices for the whole run up front:
+        # 3-5 forms per quarter, then one teacher and one status per form
+        periods = [(year, quarter) for year in years for quarter in quarters]
+        forms_per_period = random.choices(range(3, 6), k=len(periods))
+        total_to_generate = sum(forms_per_period)
+        form_teachers = iter(random.choices(teachers, k=total_to_generate))
+        form_estados = iter(random.choices(_ESTADOS, k=total_to_generate))
         
-        for year in years:
-            for quarter in quarters:
-                # Generate 3-5 forms per quarter
-                forms_this_quarter = random.randint(3, 5)
+        for (year, quarter), forms_this_quarter in zip(periods, forms_per_period):
+            for _ in range(forms_this_quarter):
+                teacher = next(form_teachers)
+                
+                # Create form data
+                form_data = {
+                    "nombre_completo": teacher[0],
+                    "correo_institucional": teacher[1],
+                    "año_academico": year,
+                    "trimestre": quarter,
+                    "estado": next(form_estados),
+                    "fecha_envio": generate_random_date_in_quarter(year, quarter),
+                    "fecha_revision": None,
+                    "revisado_por": None
+                }
                 
-                for _ in range(forms_this_quarter):
-                    teacher = random.choice(teachers)
-                    
-                    # Create form data
-                    form_data = {
-                        "nombre_completo": teacher[0],
-                        "correo_institucional": teacher[1],
-                        "año_academico": year,
-                        "trimestre": quarter,
-                        "estado": random.choice(["APROBADO", "PENDIENTE", "RECHAZADO"]),
-                        "fecha_envio": generate_random_date_in_quarter(year, quarter),
-                        "fecha_revision": None,
-                        "revisado_por": None
-                    }
-                    
-                    # Add revision data if approved or rejected
-                    if form_data["estado"] != "PENDIENTE":
-                        form_data["fecha_revision"] = form_data["fecha_envio"] + timedelta(days=random.randint(1, 7))
-                        form_data["revisado_por"] = "Administrador"
-                    
-                    # Generate activities
-                    form_data["cursos_capacitacion"] = generate_cursos_capacitacion()
-                    form_data["publicaciones"] = generate_publicaciones()
-                    form_data["eventos_academicos"] = generate_eventos_academicos()
-                    form_data["diseno_curricular"] = generate_diseno_curricular()
-                    form_data["movilidad"] = generate_movilidad()
-                    form_data["reconocimientos"] = generate_reconocimientos()
-                    form_data["certificaciones"] = generate_certificaciones()
-                    form_data["otras_actividades"] = generate_otras_actividades()
-                    
-                    # Create the form
-                    formulario = crud.create_formulario_completo(form_data)
-                    if formulario:
-                        total_forms += 1
-                        print(f"✅ Formulario creado: {teacher[0]} - {year} {quarter}")
-                    else:
-                        print(f"❌ Error creando formulario para {teacher[0]} - {year} {quarter}")
+                # Add revision data if approved or rejected
+                if form_data["estado"] != "PENDIENTE":
+                    form_data["fecha_revision"] = form_data["fecha_envio"] + timedelta(days=random.randint(1, 7))
+                    form_data["revisado_por"] = "Administrador"
+                
+                # Generate activities
+                form_data["cursos_capacitacion"] = generate_cursos_capacitacion()
+                form_data["publicaciones"] = generate_publicaciones()
+                form_data["eventos_academicos"] = generate_eventos_academicos()
+                form_data["diseno_curricular"] = generate_diseno_curricular()
+                form_data["movilidad"] = generate_movilidad()
+                form_data["reconocimientos"] = generate_reconocimientos()
+                form_data["certificaciones"] = generate_certificaciones()
+                form_data["otras_actividades"] = generate_otras_actividades()
+                
+                batch.append(form_data)
+        
+        total_forms = crud.create_formularios_bulk(batch)
+        if total_forms:
+            for form_data in batch:
+                print(f"✅ Formulario creado: {form_data['nombre_completo']} - "
+                      f"{form_data['año_academico']} {form_data['trimestre']}")
+        else:
+            print(f"❌ Error creando los {len(batch)} formularios de prueba")
         
         print(f"\n🎉 ¡Datos de prueba generados exitosamente!")
         print(f"📊 Total de formularios creados: {total_forms}")
@@ -217,29 +230,114 @@ def generate_random_date_in_quarter(year: int, quarter: str) -> datetime:
     
     return datetime(year, month, day, hour, minute)
 
+# Fixed catalogues the generators sample from
+_ESTADOS = ("APROBADO", "PENDIENTE", "RECHAZADO")
+
+_TRAINING_COURSES = (
+    "Metodologías Activas de Aprendizaje",
+    "Tecnologías Educativas Digitales",
+    "Evaluación por Competencias",
+    "Diseño Curricular Basado en Competencias",
+    "Investigación Educativa",
+    "Gestión de Aulas Virtuales",
+    "Pedagogía Inclusiva",
+    "Neuroeducación y Aprendizaje",
+    "Liderazgo Académico",
+    "Innovación Educativa"
+)
+
+_PUBLICATION_TITLES = (
+    "Innovación en Metodologías de Enseñanza Superior",
+    "El Impacto de la Tecnología en el Aprendizaje",
+    "Estrategias de Evaluación Formativa",
+    "Desarrollo de Competencias Digitales en Docentes",
+    "Pedagogía Inclusiva en el Aula Universitaria",
+    "Investigación-Acción en Contextos Educativos",
+    "Neurociencia y Educación: Nuevos Paradigmas",
+    "Gestión del Conocimiento en Instituciones Educativas"
+)
+
+_JOURNALS = (
+    "Revista de Educación Superior",
+    "Journal of Educational Innovation",
+    "Revista Iberoamericana de Educación",
+    "Educational Technology & Society",
+    "Revista de Investigación Educativa",
+    "International Journal of Educational Research"
+)
+
+_ACADEMIC_EVENTS = (
+    "Congreso Internacional de Educación Superior",
+    "Simposio de Innovación Educativa",
+    "Conferencia de Tecnología Educativa",
+    "Encuentro de Investigación Pedagógica",
+    "Seminario de Metodologías Activas",
+    "Foro de Buenas Prácticas Docentes",
+    "Workshop de Evaluación Educativa",
+    "Coloquio de Neuroeducación"
+)
+
+_CURRICULUM_COURSES = (
+    "Fundamentos de Programación",
+    "Metodología de la Investigación",
+    "Estadística Aplicada",
+    "Diseño de Sistemas",
+    "Gestión de Proyectos",
+    "Ética Profesional",
+    "Comunicación Efectiva",
+    "Emprendimiento e Innovación"
+)
+
+_MOBILITY_EXPERIENCES = (
+    "Intercambio académico con Universidad de Barcelona",
+    "Estancia de investigación en MIT",
+    "Programa de movilidad docente con Universidad Nacional de Colombia",
+    "Conferencia magistral en Universidad de Chile",
+    "Colaboración internacional con Oxford University",
+    "Participación en programa Erasmus+"
+)
+
+_RECOGNITIONS = (
+    ("Mejor Docente del Año", "PREMIO"),
+    ("Reconocimiento a la Excelencia Académica", "DISTINCION"),
+    ("Doctorado Honoris Causa", "GRADO"),
+    ("Premio a la Innovación Educativa", "PREMIO"),
+    ("Distinción por Trayectoria Académica", "DISTINCION"),
+    ("Miembro Honorario de la Academia", "DISTINCION")
+)
+
+_CERTIFICATIONS = (
+    "Certificación en Google for Education",
+    "Microsoft Certified Educator",
+    "Certificación en Moodle",
+    "Canvas Certified Educator",
+    "Certificación en Design Thinking",
+    "Scrum Master Certification",
+    "Certificación en Metodologías Ágiles",
+    "AWS Certified Cloud Practitioner"
+)
+
+_OTHER_ACTIVITIES = (
+    ("Asesoría y Titulación", "Dirección de tesis de licenciatura", "Asesoría académica para estudiantes en proceso de titulación"),
+    ("Solicitudes Atendidas", "Atención a solicitudes estudiantiles", "Resolución de consultas académicas y administrativas"),
+    ("Comités Académicos", "Participación en Comité Curricular", "Colaboración en revisión y actualización de planes de estudio"),
+    ("Evaluación Externa", "Evaluador de proyectos de investigación", "Revisión y evaluación de propuestas de investigación"),
+    ("Mentoría Docente", "Programa de mentoría para nuevos profesores", "Acompañamiento y orientación a docentes de reciente ingreso"),
+    ("Vinculación Empresarial", "Coordinación de prácticas profesionales", "Gestión de convenios y seguimiento de estudiantes en empresas"),
+    ("Divulgación Científica", "Conferencias magistrales", "Presentaciones de divulgación científica para público general"),
+    ("Gestión Académica", "Coordinación de programa académico", "Administración y seguimiento de programas educativos")
+)
+
 def generate_cursos_capacitacion():
     """Generate sample training courses"""
-    courses = [
-        "Metodologías Activas de Aprendizaje",
-        "Tecnologías Educativas Digitales",
-        "Evaluación por Competencias",
-        "Diseño Curricular Basado en Competencias",
-        "Investigación Educativa",
-        "Gestión de Aulas Virtuales",
-        "Pedagogía Inclusiva",
-        "Neuroeducación y Aprendizaje",
-        "Liderazgo Académico",
-        "Innovación Educativa"
-    ]
-    
     num_courses = random.randint(1, 4)
-    selected_courses = random.sample(courses, num_courses)
+    selected_courses = random.sample(_TRAINING_COURSES, num_courses)
     
     result = []
     for course in selected_courses:
         result.append({
             "nombre_curso": course,
-            "fecha": fake.date_between(start_date='-1y', end_date='today').isoformat(),
+            "fecha": random.choice(_DATE_POOL_1Y),
             "horas": random.choice([20, 30, 40, 50, 60, 80, 100])
         })
     
@@ -250,38 +348,18 @@ def generate_publicaciones():
     if random.random() < 0.3:  # 30% chance of no publications
         return []
     
-    publication_titles = [
-        "Innovación en Metodologías de Enseñanza Superior",
-        "El Impacto de la Tecnología en el Aprendizaje",
-        "Estrategias de Evaluación Formativa",
-        "Desarrollo de Competencias Digitales en Docentes",
-        "Pedagogía Inclusiva en el Aula Universitaria",
-        "Investigación-Acción en Contextos Educativos",
-        "Neurociencia y Educación: Nuevos Paradigmas",
-        "Gestión del Conocimiento en Instituciones Educativas"
-    ]
-    
-    journals = [
-        "Revista de Educación Superior",
-        "Journal of Educational Innovation",
-        "Revista Iberoamericana de Educación",
-        "Educational Technology & Society",
-        "Revista de Investigación Educativa",
-        "International Journal of Educational Research"
-    ]
-    
     num_pubs = random.randint(1, 3)
     result = []
     
     for _ in range(num_pubs):
         # Generate co-authors
         num_authors = random.randint(1, 4)
-        authors = [fake.name() for _ in range(num_authors)]
+        authors = random.sample(_NAME_POOL, num_authors)
         
         result.append({
             "autores": ", ".join(authors),
-            "titulo": random.choice(publication_titles),
-            "evento_revista": random.choice(journals),
+            "titulo": random.choice(_PUBLICATION_TITLES),
+            "evento_revista": random.choice(_JOURNALS),
             "estatus": random.choice(["ACEPTADO", "EN_REVISION", "PUBLICADO"])
         })
     
@@ -292,24 +370,13 @@ def generate_eventos_academicos():
     if random.random() < 0.2:  # 20% chance of no events
         return []
     
-    events = [
-        "Congreso Internacional de Educación Superior",
-        "Simposio de Innovación Educativa",
-        "Conferencia de Tecnología Educativa",
-        "Encuentro de Investigación Pedagógica",
-        "Seminario de Metodologías Activas",
-        "Foro de Buenas Prácticas Docentes",
-        "Workshop de Evaluación Educativa",
-        "Coloquio de Neuroeducación"
-    ]
-    
     num_events = random.randint(1, 3)
     result = []
     
     for _ in range(num_events):
         result.append({
-            "nombre_evento": random.choice(events),
-            "fecha": fake.date_between(start_date='-1y', end_date='today').isoformat(),
+            "nombre_evento": random.choice(_ACADEMIC_EVENTS),
+            "fecha": random.choice(_DATE_POOL_1Y),
             "tipo_participacion": random.choice(["ORGANIZADOR", "PARTICIPANTE", "PONENTE"])
         })
     
@@ -320,22 +387,11 @@ def generate_diseno_curricular():
     if random.random() < 0.4:  # 40% chance of no curriculum design
         return []
     
-    courses = [
-        "Fundamentos de Programación",
-        "Metodología de la Investigación",
-        "Estadística Aplicada",
-        "Diseño de Sistemas",
-        "Gestión de Proyectos",
-        "Ética Profesional",
-        "Comunicación Efectiva",
-        "Emprendimiento e Innovación"
-    ]
-    
     num_designs = random.randint(1, 2)
     result = []
     
     for _ in range(num_designs):
-        course = random.choice(courses)
+        course = random.choice(_CURRICULUM_COURSES)
         result.append({
             "nombre_curso": course,
             "descripcion": f"Diseño curricular completo para la materia {course}, incluyendo objetivos, contenidos, metodología y evaluación."
@@ -348,22 +404,13 @@ def generate_movilidad():
     if random.random() < 0.7:  # 70% chance of no mobility
         return []
     
-    experiences = [
-        "Intercambio académico con Universidad de Barcelona",
-        "Estancia de investigación en MIT",
-        "Programa de movilidad docente con Universidad Nacional de Colombia",
-        "Conferencia magistral en Universidad de Chile",
-        "Colaboración internacional con Oxford University",
-        "Participación en programa Erasmus+"
-    ]
-    
     result = []
-    experience = random.choice(experiences)
+    experience = random.choice(_MOBILITY_EXPERIENCES)
     
     result.append({
         "descripcion": experience,
         "tipo": "INTERNACIONAL" if any(word in experience.lower() for word in ["internacional", "mit", "oxford", "barcelona", "erasmus"]) else "NACIONAL",
-        "fecha": fake.date_between(start_date='-2y', end_date='today').isoformat()
+        "fecha": random.choice(_DATE_POOL_2Y)
     })
     
     return result
@@ -373,21 +420,12 @@ def generate_reconocimientos():
     if random.random() < 0.6:  # 60% chance of no recognitions
         return []
     
-    recognitions = [
-        ("Mejor Docente del Año", "PREMIO"),
-        ("Reconocimiento a la Excelencia Académica", "DISTINCION"),
-        ("Doctorado Honoris Causa", "GRADO"),
-        ("Premio a la Innovación Educativa", "PREMIO"),
-        ("Distinción por Trayectoria Académica", "DISTINCION"),
-        ("Miembro Honorario de la Academia", "DISTINCION")
-    ]
-    
-    recognition = random.choice(recognitions)
+    recognition = random.choice(_RECOGNITIONS)
     
     return [{
         "nombre": recognition[0],
         "tipo": recognition[1],
-        "fecha": fake.date_between(start_date='-3y', end_date='today').isoformat()
+        "fecha": random.choice(_DATE_POOL_3Y)
     }]
 
 def generate_certificaciones():
@@ -395,25 +433,14 @@ def generate_certificaciones():
     if random.random() < 0.3:  # 30% chance of no certifications
         return []
     
-    certifications = [
-        "Certificación en Google for Education",
-        "Microsoft Certified Educator",
-        "Certificación en Moodle",
-        "Canvas Certified Educator",
-        "Certificación en Design Thinking",
-        "Scrum Master Certification",
-        "Certificación en Metodologías Ágiles",
-        "AWS Certified Cloud Practitioner"
-    ]
-    
     num_certs = random.randint(1, 2)
-    selected_certs = random.sample(certifications, num_certs)
+    selected_certs = random.sample(_CERTIFICATIONS, num_certs)
     
     result = []
     for cert in selected_certs:
         result.append({
             "nombre": cert,
-            "fecha_obtencion": fake.date_between(start_date='-2y', end_date='today').isoformat()
+            "fecha_obtencion": random.choice(_DATE_POOL_2Y)
         })
     
     return result
@@ -423,19 +450,8 @@ def generate_otras_actividades():
     if random.random() < 0.4:  # 40% chance of no other activities
         return []
     
-    activities = [
-        ("Asesoría y Titulación", "Dirección de tesis de licenciatura", "Asesoría académica para estudiantes en proceso de titulación"),
-        ("Solicitudes Atendidas", "Atención a solicitudes estudiantiles", "Resolución de consultas académicas y administrativas"),
-        ("Comités Académicos", "Participación en Comité Curricular", "Colaboración en revisión y actualización de planes de estudio"),
-        ("Evaluación Externa", "Evaluador de proyectos de investigación", "Revisión y evaluación de propuestas de investigación"),
-        ("Mentoría Docente", "Programa de mentoría para nuevos profesores", "Acompañamiento y orientación a docentes de reciente ingreso"),
-        ("Vinculación Empresarial", "Coordinación de prácticas profesionales", "Gestión de convenios y seguimiento de estudiantes en empresas"),
-        ("Divulgación Científica", "Conferencias magistrales", "Presentaciones de divulgación científica para público general"),
-        ("Gestión Académica", "Coordinación de programa académico", "Administración y seguimiento de programas educativos")
-    ]
-    
     num_activities = random.randint(1, 3)
-    selected_activities = random.sample(activities, num_activities)
+    selected_activities = random.sample(_OTHER_ACTIVITIES, num_activities)
     
     result = []
     for categoria, titulo, descripcion in selected_activities:
@@ -443,7 +459,7 @@ def generate_otras_actividades():
             "categoria": categoria,
             "titulo": titulo,
             "descripcion": descripcion,
-            "fecha": fake.date_between(start_date='-1y', end_date='today').isoformat(),
+            "fecha": random.choice(_DATE_POOL_1Y),
             "cantidad": random.randint(1, 10) if categoria in ["Solicitudes Atendidas", "Asesoría y Titulación"] else None,
             "observaciones": "Actividad completada satisfactoriamente" if random.random() < 0.3 else None
         })
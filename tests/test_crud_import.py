@@ -0,0 +1,129 @@
+"""
+The single-form and bulk import paths must store the same rows.
+"""
+
+import os
+import sys
+from datetime import datetime
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+pytest.importorskip("sqlalchemy")
+pytest.importorskip("pydantic")
+
+from sqlalchemy import create_engine, select
+from sqlalchemy.orm import Session
+
+from app.database.crud import FormularioCRUD
+from app.models.database import (
+    Base, FormularioEnvioDB, CursoCapacitacionDB, PublicacionDB, EventoAcademicoDB,
+    DisenoCurricularDB, ExperienciaMovilidadDB, ReconocimientoDB, CertificacionDB,
+    OtraActividadAcademicaDB, AuditLogDB
+)
+
+CHILD_MODELS = [
+    CursoCapacitacionDB, PublicacionDB, EventoAcademicoDB, DisenoCurricularDB,
+    ExperienciaMovilidadDB, ReconocimientoDB, CertificacionDB, OtraActividadAcademicaDB
+]
+
+PAYLOAD = [
+    {
+        "nombre_completo": "Ana López",
+        "correo_institucional": "ana.lopez@universidad.edu",
+        "año_academico": 2025,
+        "trimestre": "Q1",
+        "estado": "APROBADO",
+        "fecha_envio": datetime(2025, 2, 3, 10, 15),
+        "fecha_revision": datetime(2025, 2, 5, 9, 0),
+        "revisado_por": "admin",
+        "cursos_capacitacion": [
+            {"nombre_curso": "Python", "fecha": "2025-01-20", "horas": 20},
+            {"nombre_curso": "Docencia", "fecha": "2025-01-27"}
+        ],
+        "publicaciones": [
+            {"autores": "López, A.", "titulo": "Datos abiertos",
+             "evento_revista": "Revista X", "estatus": "ACEPTADO"}
+        ],
+        "eventos_academicos": [
+            {"nombre_evento": "Congreso", "fecha": "2025-01-10",
+             "tipo_participacion": "PONENTE"}
+        ],
+        "diseno_curricular": [
+            {"nombre_curso": "Bases de datos", "descripcion": "Nuevo temario"}
+        ],
+        "movilidad": [
+            {"descripcion": "Estancia", "tipo": "INTERNACIONAL", "fecha": "2025-01-15"}
+        ],
+        "reconocimientos": [
+            {"nombre": "Mérito docente", "fecha": "2025-01-30"}
+        ],
+        "certificaciones": [
+            {"nombre": "Scrum", "fecha_obtencion": "2025-01-05"}
+        ],
+        "otras_actividades": [
+            {"categoria": "ASESORIA Y TITULACION", "titulo": "Tesis", "fecha": "2025-01-12",
+             "cantidad": 3, "observaciones": "Licenciatura"}
+        ]
+    },
+    {
+        "nombre_completo": "Luis Pérez",
+        "correo_institucional": "luis.perez@universidad.edu",
+        "año_academico": 2025,
+        "trimestre": "Q2",
+        "fecha_envio": datetime(2025, 4, 8, 12, 0),
+        "publicaciones": [
+            {"autores": "Pérez, L.", "titulo": "Redes", "evento_revista": "Congreso Y"}
+        ],
+        "otras_actividades": [
+            {"categoria": "SOLICITUDES ATENDIDAS", "titulo": "Constancias", "cantidad": 12}
+        ]
+    }
+]
+
+
+def table_rows(session, model, form_ids):
+    """Rows of a table without surrogate ids; parents are referenced by payload position"""
+    position = {form_id: i for i, form_id in enumerate(form_ids)}
+    skipped = {"id", "fecha"} if model is AuditLogDB else {"id"}
+    columns = [c for c in model.__table__.columns if c.name not in skipped]
+    rows = []
+    for row in session.execute(select(*columns)).mappings():
+        row = dict(row)
+        if "formulario_id" in row:
+            row["formulario_id"] = position[row["formulario_id"]]
+        rows.append(row)
+    return sorted(rows, key=repr)
+
+
+def import_rows(import_forms):
+    """Import PAYLOAD into a fresh database and return every table's rows"""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        import_forms(FormularioCRUD(session))
+        form_ids = session.scalars(
+            select(FormularioEnvioDB.id).order_by(FormularioEnvioDB.id)).all()
+        return {
+            model.__tablename__: table_rows(session, model, form_ids)
+            for model in [FormularioEnvioDB, *CHILD_MODELS, AuditLogDB]
+        }
+
+
+def test_bulk_import_matches_single_form_import():
+    def one_by_one(crud):
+        for form_dict in PAYLOAD:
+            assert crud.create_formulario_completo(form_dict) is not None
+
+    def bulk(crud):
+        assert crud.create_formularios_bulk(PAYLOAD) == len(PAYLOAD)
+
+    single_rows = import_rows(one_by_one)
+    bulk_rows = import_rows(bulk)
+
+    assert single_rows == bulk_rows
+    # Every child table, otras_actividades included, is actually filled
+    for model in CHILD_MODELS:
+        assert single_rows[model.__tablename__], model.__tablename__
+    assert len(single_rows["audit_log"]) == len(PAYLOAD)